@@ -51,27 +51,37 @@ async def debug_journal_format():
     # Remove duplicates
     formats_to_try = list(dict.fromkeys(formats_to_try))
     
-    for format_name in formats_to_try:
+    # Probe all formats concurrently (bounded) instead of one round-trip at
+    # a time; the shared connection pool handles the parallel requests.
+    semaphore = asyncio.Semaphore(10)
+
+    async def probe(format_name):
+        async with semaphore:
+            return await client.get_page(format_name)
+
+    results = await asyncio.gather(
+        *(probe(f) for f in formats_to_try), return_exceptions=True
+    )
+
+    for format_name, page in zip(formats_to_try, results, strict=True):
         print(f"\n📝 Trying format: '{format_name}'")
-        try:
-            page = await client.get_page(format_name)
-            if page:
-                print(f"✅ FOUND! Page exists with format: '{format_name}'")
-                print(f"   UUID: {page.get('uuid')}")
-                print(f"   Original name: {page.get('originalName')}")
-                
-                # Try to get blocks
-                blocks = await client.get_page_blocks(format_name)
-                print(f"   Blocks found: {len(blocks)}")
-                if blocks:
-                    print(f"   First block preview: {str(blocks[0])[:100]}...")
-                    
-                return format_name
-            else:
-                print(f"❌ Not found with this format")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-    
+        if isinstance(page, Exception):
+            print(f"❌ Error: {page}")
+        elif page:
+            print(f"✅ FOUND! Page exists with format: '{format_name}'")
+            print(f"   UUID: {page.get('uuid')}")
+            print(f"   Original name: {page.get('originalName')}")
+
+            # Try to get blocks
+            blocks = await client.get_page_blocks(format_name)
+            print(f"   Blocks found: {len(blocks)}")
+            if blocks:
+                print(f"   First block preview: {str(blocks[0])[:100]}...")
+
+            return format_name
+        else:
+            print(f"❌ Not found with this format")
+
     print("\n\n💡 Tip: Check your Logseq journal format settings!")
     print("You can also list all pages to see the exact format:")
     print("\n📋 Listing journal pages...")
@@ -8,6 +8,17 @@ from .server import main
 
 def run():
     """Run the MCP server."""
+    if sys.platform != "win32":
+        # Use uvloop's libuv-backed event loop when available; it cuts
+        # selector and task-scheduling overhead for socket-heavy async
+        # workloads. Purely optional — the default loop works fine.
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,100 @@
+"""Async TTL cache for read-only Logseq API calls."""
+
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def async_ttl_cache(maxsize: int = 512, ttl: float = 30.0) -> Callable[[F], F]:
+    """Cache coroutine results with TTL expiry and LRU eviction.
+
+    Designed for the read-only ``LogseqClient`` methods: the full bound
+    arguments (including ``self``) form the key, so each client instance
+    keeps separate entries. Call arguments are normalized through the
+    function signature, so positional and keyword spellings of the same
+    call share one entry.
+
+    Concurrent calls for the same key are coalesced: the first caller
+    runs the function while the rest await its in-flight future, so a
+    burst of identical reads costs one API round-trip instead of N.
+
+    The decorated function gains two helpers:
+
+    - ``cache_clear()``: drop every entry (used by write methods)
+    - ``cache_invalidate(*args, **kwargs)``: drop the entry for one call
+
+    Args:
+        maxsize: Maximum number of cached entries before LRU eviction
+        ttl: Seconds a cached value stays fresh
+
+    Returns:
+        The decorator to apply to an async function or method
+    """
+
+    def decorator(func: F) -> F:
+        cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        in_flight: dict[tuple, asyncio.Future] = {}
+        lock = asyncio.Lock()
+        signature = inspect.signature(func)
+
+        def make_key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            now = time.monotonic()
+            async with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    expiry, value = entry
+                    if expiry > now:
+                        cache.move_to_end(key)
+                        return value
+                    del cache[key]
+                pending = in_flight.get(key)
+                if pending is not None:
+                    # Another task is already fetching this key; wait for
+                    # its result instead of issuing a duplicate call.
+                    future = pending
+                else:
+                    future = asyncio.get_running_loop().create_future()
+                    in_flight[key] = future
+            if future is not pending:
+                try:
+                    value = await func(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                    # Mark retrieved so a waiter-less failure does not
+                    # trigger the "exception never retrieved" warning.
+                    future.exception()
+                    async with lock:
+                        in_flight.pop(key, None)
+                    raise
+                future.set_result(value)
+                async with lock:
+                    in_flight.pop(key, None)
+                    if len(cache) >= maxsize:
+                        cache.popitem(last=False)
+                    cache[key] = (now + ttl, value)
+                return value
+            return await asyncio.shield(future)
+
+        def cache_clear() -> None:
+            cache.clear()
+
+        def cache_invalidate(*args: Any, **kwargs: Any) -> None:
+            cache.pop(make_key(args, kwargs), None)
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_invalidate = cache_invalidate  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -1,20 +1,39 @@
 """Logging configuration for the Logseq MCP server."""
 
-import copy
-import json
 import logging
 import logging.handlers
 import os
-import re
+import queue
 import sys
-import typing
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 from .utils.sanitizer import LogSanitizer
 
+# One sanitizer shared by every PrivacyFilter; it is stateless after
+# construction so reconfiguring logging never needs a fresh instance.
+_SANITIZER = LogSanitizer()
+
+# Background listener that drains the log queue; kept at module level so
+# reconfiguration and shutdown can stop it.
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+# Last configuration applied by setup_logging; repeated calls with the same
+# settings are no-ops.
+_CONFIGURED: Optional[tuple] = None
+
+# Resolved log file path from the last setup_logging call. The file handler
+# lives behind the queue listener, not on the root logger, so callers that
+# want to report the location ask here instead of probing handlers.
+_LOG_FILE_PATH: Optional[Path] = None
+
 
 class LoggingMode(Enum):
     """Logging modes for different privacy levels."""
@@ -35,7 +54,11 @@ class PrivacyFilter(logging.Filter):
         """
         super().__init__()
         self.mode = mode
-        self.sanitizer = LogSanitizer()
+        self.sanitizer = _SANITIZER
+        # Precomputed per-mode flags; filter() runs per record, so avoid
+        # repeated enum comparisons there.
+        self._minimal = mode == LoggingMode.MINIMAL
+        self._privacy = mode == LoggingMode.PRIVACY
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and sanitize log records based on mode.
@@ -47,87 +70,93 @@ class PrivacyFilter(logging.Filter):
             True to include the record, False to exclude it
         """
         # In minimal mode, only allow warnings and errors
-        if self.mode == LoggingMode.MINIMAL:
+        if self._minimal:
             if record.levelno < logging.WARNING:
                 return False
 
         # In privacy mode, sanitize sensitive data
-        if self.mode == LoggingMode.PRIVACY:
-            # Sanitize the main message
-            if hasattr(record, "msg") and isinstance(record.msg, str):
-                # Look for common patterns in messages
-                def sanitize_page_pattern(m: re.Match[str]) -> str:
-                    return f"page: '{self.sanitizer.sanitize_page_name(m.group(1))}'"
-
-                def sanitize_getting_page(m: re.Match[str]) -> str:
-                    return (
-                        f"Getting page: {self.sanitizer.sanitize_page_name(m.group(1))}"
-                    )
-
-                def sanitize_creating_page(m: re.Match[str]) -> str:
-                    return f"Creating page: {self.sanitizer.sanitize_page_name(m.group(1))}"
-
-                def sanitize_search_query(m: re.Match[str]) -> str:
-                    return f"Searching pages with query: {self.sanitizer.sanitize_query(m.group(1))}"
-
-                def sanitize_datalog_query(m: re.Match[str]) -> str:
-                    return f"Executing Datalog query: {self.sanitizer.sanitize_query(m.group(1))}"
-
-                patterns: list[tuple[str, typing.Callable[[re.Match[str]], str]]] = [
-                    (r"page: ['\"]([^'\"]+)['\"]", sanitize_page_pattern),
-                    (r"Getting page: ([^'\"]+)", sanitize_getting_page),
-                    (r"Creating page: ([^'\"]+)", sanitize_creating_page),
-                    (r"Searching pages with query: (.+)", sanitize_search_query),
-                    (r"Executing Datalog query: (.+)", sanitize_datalog_query),
-                ]
-                for pattern, replacement in patterns:
-                    record.msg = re.sub(pattern, replacement, record.msg)
-
-            # Sanitize extra fields - IMPORTANT: Use deep copies to avoid modifying original data
-            if hasattr(record, "arguments") and getattr(record, "arguments", None):
-                # Deep copy to avoid modifying the original arguments
-                arguments = getattr(record, "arguments")
-                setattr(record, "arguments", copy.deepcopy(arguments))
-                setattr(
-                    record,
-                    "arguments",
-                    self.sanitizer.sanitize_dict(getattr(record, "arguments")),
+        if self._privacy:
+            # Sensitive values arrive as structured extra fields rather than
+            # interpolated into the message; work on the record's __dict__
+            # directly to skip repeated hasattr/getattr lookups.
+            record_dict = record.__dict__
+            if "page_name" in record_dict:
+                record_dict["page_name"] = self.sanitizer.sanitize_page_name(
+                    record_dict["page_name"]
+                )
+            if "search_query" in record_dict:
+                record_dict["search_query"] = self.sanitizer.sanitize_query(
+                    record_dict["search_query"]
+                )
+            if "datalog_query" in record_dict:
+                record_dict["datalog_query"] = self.sanitizer.sanitize_query(
+                    record_dict["datalog_query"]
                 )
 
-            if hasattr(record, "result") and isinstance(
-                getattr(record, "result", None), dict
-            ):
-                # Deep copy the entire result to avoid modifying original data
-                result = getattr(record, "result")
-                setattr(record, "result", copy.deepcopy(result))
+            # Sanitize extra fields. sanitize_dict builds a fresh structure, so
+            # the caller's original data is never mutated and no deepcopy is
+            # needed.
+            arguments = record_dict.get("arguments")
+            if arguments:
+                record_dict["arguments"] = self.sanitizer.sanitize_dict(arguments)
 
-                # Now we can safely sanitize the copied data
-                result = getattr(record, "result")
+            if isinstance(record_dict.get("result"), dict):
+                # Build a sanitized copy rather than mutating the original
+                result = dict(record_dict["result"])
                 if "page" in result:
                     if (
                         isinstance(result["page"], dict)
                         and "originalName" in result["page"]
                     ):
-                        result["page"]["originalName"] = (
-                            self.sanitizer.sanitize_page_name(
+                        result["page"] = {
+                            **result["page"],
+                            "originalName": self.sanitizer.sanitize_page_name(
                                 result["page"]["originalName"]
-                            )
-                        )
+                            ),
+                        }
                 if "pages" in result and isinstance(result["pages"], list):
                     result["pages"] = f"[list_with_{len(result['pages'])}_pages]"
                 if "results" in result and isinstance(result["results"], list):
                     result["results"] = f"[list_with_{len(result['results'])}_results]"
+                record_dict["result"] = result
 
         return True
 
 
+# Structured extra fields that JSONFormatter copies into the output record.
+_EXTRA_FIELDS = frozenset(
+    {
+        "tool_name",
+        "arguments",
+        "page_name",
+        "search_query",
+        "datalog_query",
+        "result",
+        "error",
+        "duration_ms",
+        "log_level",
+        "log_file",
+        "debug_mode",
+        "log_mode",
+        "max_file_size",
+        "retention_days",
+    }
+)
+
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
+        # Format the record's own creation time; cheaper than building and
+        # re-formatting a timezone-aware datetime per record.
+        timestamp = (
+            f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))}"
+            f".{int(record.msecs * 1000):06d}Z"
+        )
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -140,49 +169,95 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields if present
-        extra_fields = [
-            "tool_name",
-            "arguments",
-            "result",
-            "error",
-            "duration_ms",
-            "log_level",
-            "log_file",
-            "debug_mode",
-            "log_mode",
-            "max_file_size",
-            "retention_days",
-        ]
-
-        for field in extra_fields:
-            if hasattr(record, field):
-                value = getattr(record, field)
-                if value is not None:
-                    log_data[field] = value
-
-        return json.dumps(log_data)
-
-
-class StderrFilter(logging.Filter):
-    """Filter to ensure only ERROR and above go to stderr."""
+        # Add extra fields if present; intersecting the record's __dict__
+        # avoids a hasattr/getattr pair per candidate field.
+        record_dict = record.__dict__
+        for field in _EXTRA_FIELDS.intersection(record_dict):
+            value = record_dict[field]
+            if value is not None:
+                log_data[field] = value
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Only allow ERROR and above."""
-        return record.levelno >= logging.ERROR
+        # orjson encodes in C; default=str keeps arbitrary extra values loggable
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class _SameProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock prepare() pre-formats the message and strips exc_info so
+    records survive pickling across processes, which would inline
+    tracebacks into the message and starve JSONFormatter's structured
+    "exception" field. Our listener is a thread in the same process, so
+    the record can cross the queue as-is and be formatted there.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_SIZE_SUFFIXES = {"GB": 1 << 30, "MB": 1 << 20, "KB": 1 << 10}
 
 
 def parse_size(size_str: str) -> int:
     """Parse size string like '10MB' to bytes."""
     size_str = size_str.upper().strip()
-    if size_str.endswith("GB"):
-        return int(size_str[:-2]) * 1024 * 1024 * 1024
-    elif size_str.endswith("MB"):
-        return int(size_str[:-2]) * 1024 * 1024
-    elif size_str.endswith("KB"):
-        return int(size_str[:-2]) * 1024
-    else:
-        return int(size_str)
+    multiplier = _SIZE_SUFFIXES.get(size_str[-2:])
+    if multiplier:
+        return int(size_str[:-2]) * multiplier
+    return int(size_str)
+
+
+@dataclass(frozen=True)
+class _EnvConfig:
+    """Environment overrides for logging, read once per process."""
+
+    level: Optional[str]
+    file: Optional[str]
+    debug: bool
+    mode: Optional[str]
+    retention: Optional[str]
+    max_size: Optional[str]
+
+
+@lru_cache(maxsize=4)
+def _resolve_log_path(env_file: Optional[str], retention_days: Optional[int]) -> Path:
+    """Resolve (and create the directory for) the log file path.
+
+    Memoized so repeated setup_logging calls skip the mkdir/stat syscalls.
+    """
+    if env_file is None:
+        # Try to get project root from environment variable first
+        project_root_env = os.getenv("LOGSEQ_MCP_PROJECT_ROOT")
+        if project_root_env:
+            project_root = Path(project_root_env)
+        else:
+            # Fallback to relative path from __file__
+            project_root = Path(__file__).parent.parent.parent
+
+        log_dir = project_root / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Use retention-based naming if retention is set
+        if retention_days:
+            return log_dir / "logseq-mcp.log"
+        return log_dir / f"logseq-mcp-{datetime.now():%Y%m%d}.log"
+
+    log_file_path = Path(env_file)
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+    return log_file_path
+
+
+@lru_cache(maxsize=1)
+def _load_env_config() -> _EnvConfig:
+    """Read the logging environment variables once and memoize the result."""
+    return _EnvConfig(
+        level=os.getenv("LOGSEQ_MCP_LOG_LEVEL"),
+        file=os.getenv("LOGSEQ_MCP_LOG_FILE"),
+        debug=os.getenv("LOGSEQ_MCP_DEBUG", "false").lower() == "true",
+        mode=os.getenv("LOGSEQ_MCP_LOG_MODE"),
+        retention=os.getenv("LOGSEQ_MCP_LOG_RETENTION_DAYS"),
+        max_size=os.getenv("LOGSEQ_MCP_LOG_MAX_SIZE"),
+    )
 
 
 def setup_logging(
@@ -203,13 +278,14 @@ def setup_logging(
         backup_count: Number of backup files to keep
         retention_days: Days to retain logs (used for time-based rotation)
     """
-    # Get configuration from environment
-    env_level = os.getenv("LOGSEQ_MCP_LOG_LEVEL", log_level)
-    env_file = os.getenv("LOGSEQ_MCP_LOG_FILE", log_file)
-    env_debug = os.getenv("LOGSEQ_MCP_DEBUG", "false").lower() == "true"
-    env_mode = os.getenv("LOGSEQ_MCP_LOG_MODE", log_mode or "privacy")
-    env_retention = os.getenv("LOGSEQ_MCP_LOG_RETENTION_DAYS")
-    env_max_size = os.getenv("LOGSEQ_MCP_LOG_MAX_SIZE")
+    # Get configuration from environment (parsed once per process)
+    env = _load_env_config()
+    env_level = env.level if env.level is not None else log_level
+    env_file = env.file if env.file is not None else log_file
+    env_debug = env.debug
+    env_mode = env.mode if env.mode is not None else (log_mode or "privacy")
+    env_retention = env.retention
+    env_max_size = env.max_size
 
     # Parse logging mode
     try:
@@ -234,32 +310,32 @@ def setup_logging(
             pass
 
     # Determine log file path
-    if env_file is None:
-        # Try to get project root from environment variable first
-        project_root_env = os.getenv("LOGSEQ_MCP_PROJECT_ROOT")
-        if project_root_env:
-            project_root = Path(project_root_env)
-        else:
-            # Fallback to relative path from __file__
-            project_root = Path(__file__).parent.parent.parent
-
-        log_dir = project_root / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Use retention-based naming if retention is set
-        if retention_days:
-            log_file_path = log_dir / "logseq-mcp.log"
-        else:
-            log_file_path = log_dir / f"logseq-mcp-{datetime.now():%Y%m%d}.log"
-    else:
-        log_file_path = Path(env_file)
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+    log_file_path = _resolve_log_path(env_file, retention_days)
+
+    # Short-circuit if this exact configuration is already active; repeated
+    # setup_logging calls (imports, tests) then cost a tuple comparison.
+    global _CONFIGURED, _LOG_FILE_PATH
+    config_key = (
+        env_level,
+        str(log_file_path),
+        mode,
+        max_file_size,
+        backup_count,
+        retention_days,
+        env_debug,
+    )
+    if _CONFIGURED == config_key:
+        return
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, env_level.upper(), logging.INFO))
 
-    # Remove default handlers
+    # Remove default handlers and stop any previous queue listener
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
     root_logger.handlers.clear()
 
     # Create privacy filter
@@ -298,15 +374,14 @@ def setup_logging(
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(json_formatter)
     file_handler.addFilter(privacy_filter)
-    root_logger.addHandler(file_handler)
 
     # Stderr handler for errors only (for Claude Desktop)
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setLevel(logging.ERROR)
     stderr_handler.setFormatter(console_formatter)
-    stderr_handler.addFilter(StderrFilter())
     stderr_handler.addFilter(privacy_filter)
-    root_logger.addHandler(stderr_handler)
+
+    sink_handlers = [file_handler, stderr_handler]
 
     # Optionally add stdout handler for debugging
     if env_debug or mode == LoggingMode.DEBUG:
@@ -316,7 +391,20 @@ def setup_logging(
         # Don't apply privacy filter in debug mode console
         if mode != LoggingMode.DEBUG:
             stdout_handler.addFilter(privacy_filter)
-        root_logger.addHandler(stdout_handler)
+        sink_handlers.append(stdout_handler)
+
+    # Producers only enqueue records; JSON formatting, filtering and disk
+    # writes happen on the listener's background thread, keeping file I/O
+    # (and rotation) off the event loop.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_SameProcessQueueHandler(log_queue))
+    _LISTENER = logging.handlers.QueueListener(
+        log_queue, *sink_handlers, respect_handler_level=True
+    )
+    _LISTENER.start()
+
+    _CONFIGURED = config_key
+    _LOG_FILE_PATH = log_file_path
 
     # Log startup information
     logger = logging.getLogger(__name__)
@@ -333,6 +421,24 @@ def setup_logging(
     )
 
 
+def get_log_file_path() -> Optional[Path]:
+    """Return the log file path resolved by the last setup_logging call.
+
+    None when logging has not been configured (or was shut down).
+    """
+    return _LOG_FILE_PATH
+
+
+def shutdown_logging() -> None:
+    """Stop the queue listener, flushing any pending records to disk."""
+    global _LISTENER, _CONFIGURED, _LOG_FILE_PATH
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+    _CONFIGURED = None
+    _LOG_FILE_PATH = None
+
+
 def log_tool_invocation(
     logger: logging.Logger,
     tool_name: str,
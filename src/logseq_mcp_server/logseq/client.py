@@ -1,13 +1,58 @@
 """Logseq API client."""
 
-import json
 import logging
 from typing import Any
 
 import httpx
+import orjson
+
+from ..cache import async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Connection-pool limits shared by every AsyncClient this module creates.
+# Keep-alive reuse avoids paying TCP setup on each call to the local API.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Granular timeouts: connecting to the local API should fail fast, while
+# reads keep the previous generous 30s budget for large graphs.
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=2.0, read=30.0, write=10.0, pool=1.0)
+
+# Retries apply to establishing the connection only (httpx never resends a
+# request body), so transient flakes heal without risking duplicate writes.
+_CONNECT_RETRIES = 3
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client(headers: dict[str, str] | None = None) -> httpx.AsyncClient:
+    """Return a lazily created process-wide ``httpx.AsyncClient``.
+
+    Scripts that instantiate several ``LogseqClient`` objects (or re-run in
+    a loop, like ``debug_journal.py``) can inject this client so all calls
+    share one connection pool.
+
+    Args:
+        headers: Default headers for the client; only applied on first use
+
+    Returns:
+        The shared AsyncClient instance
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=_DEFAULT_TIMEOUT,
+            headers=headers,
+            transport=httpx.AsyncHTTPTransport(
+                retries=_CONNECT_RETRIES, limits=_POOL_LIMITS
+            ),
+        )
+    return _shared_client
+
 
 class LogseqClient:
     """Client for interacting with Logseq API.
@@ -27,10 +72,21 @@ class LogseqClient:
     - q (query): "datalog-query"
     - getCurrentGraph: no args
     - getAllPages: no args or empty array
+
+    Read-only methods (get_page, get_all_pages, search_pages,
+    execute_query) cache their results briefly; every write method flushes
+    those caches so stale reads never outlive a mutation.
     """
 
     def __init__(
-        self, host: str = "localhost", port: int = 12315, token: str | None = None
+        self,
+        host: str = "localhost",
+        port: int = 12315,
+        token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = False,
     ):
         """Initialize the Logseq client.
 
@@ -38,16 +94,49 @@ class LogseqClient:
             host: Logseq API host
             port: Logseq API port
             token: Bearer token for authorization
+            client: Optional injected AsyncClient (e.g. get_shared_client());
+                injected clients are not closed by close()
+            max_connections: Connection-pool cap for the owned client
+            max_keepalive_connections: Idle keep-alive connections to retain
+            http2: Negotiate HTTP/2 when the endpoint supports it (e.g. a
+                TLS-terminating proxy in front of Logseq); requires the
+                "http2" extra. The plain local API stays on HTTP/1.1.
         """
         self.base_url = f"http://{host}:{port}/api"
         headers: dict[str, str] = {}
         if token:
             headers["Authorization"] = f"Bearer {token}"
-        self.client = httpx.AsyncClient(timeout=30.0, headers=headers)
+        if client is not None:
+            self.client = client
+            self._owns_client = False
+        else:
+            # The explicit transport carries the retry policy, pool limits
+            # and negotiated protocol version
+            self.client = httpx.AsyncClient(
+                timeout=_DEFAULT_TIMEOUT,
+                headers=headers,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=_CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=max_keepalive_connections,
+                        max_connections=max_connections,
+                        keepalive_expiry=30.0,
+                    ),
+                    http2=http2,
+                ),
+            )
+            self._owns_client = True
+
+    async def __aenter__(self) -> "LogseqClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client (no-op for injected shared clients)."""
+        if self._owns_client:
+            await self.client.aclose()
 
     async def _request(
         self, action: str, args: Any = None, data: dict[str, Any] | None = None
@@ -76,52 +165,74 @@ class LogseqClient:
             f"Logseq API request: {action}", extra={"request_data": request_data}
         )
 
-        # Log the JSON payload at INFO level for better visibility
-        logger.info(f"Sending JSON payload to Logseq API: {json.dumps(request_data)}")
+        # Log the JSON payload at INFO level for better visibility; skip the
+        # serialization entirely when nothing is listening at INFO.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Sending JSON payload to Logseq API: "
+                f"{orjson.dumps(request_data).decode()}"
+            )
 
         try:
-            response = await self.client.post(self.base_url, json=request_data)
+            # Encode the body with orjson up front; the json= kwarg would go
+            # through httpx's stdlib-json serialization instead
+            response = await self.client.post(
+                self.base_url,
+                content=orjson.dumps(request_data),
+                headers={"Content-Type": "application/json"},
+            )
             response.raise_for_status()
 
-            response_data = response.json()
-            logger.debug(
-                f"Logseq API response: {action}",
-                extra={
-                    "status_code": response.status_code,
-                    "response_data": json.dumps(response_data)[:500]
-                    if response_data
-                    else None,
-                },
-            )
+            # Parse bytes directly with orjson; response.json() would decode
+            # to str first and use the slower stdlib parser
+            response_data = orjson.loads(response.content)
 
-            # Log the response at INFO level for better visibility
-            response_preview = (
-                json.dumps(response_data)[:200] if response_data else "null"
-            )
-            logger.info(
-                f"Received response from Logseq API: {response_preview}{'...' if len(json.dumps(response_data) if response_data else '') > 200 else ''}"
-            )
+            # Serialize the response once and slice for both log previews
+            if logger.isEnabledFor(logging.INFO):
+                response_json = (
+                    orjson.dumps(response_data).decode() if response_data else "null"
+                )
+                logger.debug(
+                    f"Logseq API response: {action}",
+                    extra={
+                        "status_code": response.status_code,
+                        "response_data": response_json[:500]
+                        if response_data
+                        else None,
+                    },
+                )
+
+                # Log the response at INFO level for better visibility
+                logger.info(
+                    f"Received response from Logseq API: "
+                    f"{response_json[:200]}{'...' if len(response_json) > 200 else ''}"
+                )
 
             return response_data
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"Logseq API HTTP error: {action}",
-                extra={
-                    "status_code": e.response.status_code,
-                    "response_text": e.response.text[:500],
-                    "request_data": request_data,
-                },
-                exc_info=True,
-            )
-            raise
         except Exception as e:
-            logger.error(
-                f"Logseq API request failed: {action}",
-                extra={"request_data": request_data},
-                exc_info=True,
-            )
+            self._log_request_error(e, action, request_data)
             raise
 
+    def _log_request_error(
+        self, error: Exception, action: str, request_data: dict[str, Any]
+    ) -> None:
+        """Log a failed API request.
+
+        The traceback (and for HTTP errors, the response body) is only
+        rendered when someone is listening at DEBUG; callers re-raise and
+        typically format the exception themselves.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        extra: dict[str, Any] = {"request_data": request_data}
+        if isinstance(error, httpx.HTTPStatusError):
+            extra["status_code"] = error.response.status_code
+            if debug:
+                extra["response_text"] = error.response.text[:500]
+            message = f"Logseq API HTTP error: {action}"
+        else:
+            message = f"Logseq API request failed: {action}"
+        logger.error(message, extra=extra, exc_info=debug)
+
     async def get_current_graph(self) -> dict[str, Any]:
         """Get the current graph information.
 
@@ -161,7 +272,9 @@ class LogseqClient:
         if properties:
             args.append({"properties": properties})
 
-        return await self._request("logseq.Editor.insertBlock", args=args)
+        result = await self._request("logseq.Editor.insertBlock", args=args)
+        self._flush_read_caches()
+        return result
 
     async def update_block(
         self,
@@ -191,7 +304,9 @@ class LogseqClient:
         if properties is not None:
             args.append({"properties": properties})
 
-        return await self._request("logseq.Editor.updateBlock", args=args)
+        result = await self._request("logseq.Editor.updateBlock", args=args)
+        self._flush_read_caches()
+        return result
 
     async def delete_block(self, block_id: str) -> dict[str, Any]:
         """Delete a block.
@@ -203,7 +318,9 @@ class LogseqClient:
             Deletion result
         """
         # Logseq API expects block UUID in an array
-        return await self._request("logseq.Editor.removeBlock", args=[block_id])
+        result = await self._request("logseq.Editor.removeBlock", args=[block_id])
+        self._flush_read_caches()
+        return result
 
     async def get_block(self, block_id: str) -> dict[str, Any]:
         """Get a block by UUID.
@@ -233,6 +350,7 @@ class LogseqClient:
         """
         # Logseq API expects page name in an array
         result = await self._request("logseq.Editor.createPage", args=[name])
+        self._flush_read_caches()
 
         # If content is provided, add it as the first block
         if content and result:
@@ -240,9 +358,36 @@ class LogseqClient:
 
         return result
 
+    @staticmethod
+    def _as_list(result: Any, key: str) -> list[dict[str, Any]]:
+        """Normalize a list-or-wrapper API response to a list.
+
+        Args:
+            result: Raw API response
+            key: Wrapper key holding the list when the response is a dict
+
+        Returns:
+            The response list, or [] for empty/unrecognized shapes
+        """
+        if type(result) is list:
+            return result
+        return result.get(key, []) if result else []
+
+    @classmethod
+    def _flush_read_caches(cls) -> None:
+        """Drop all cached read results after a write."""
+        cls.get_page.cache_clear()
+        cls.get_all_pages.cache_clear()
+        cls.search_pages.cache_clear()
+        cls.execute_query.cache_clear()
+
+    @async_ttl_cache(maxsize=256, ttl=5.0)
     async def get_page(self, name: str) -> dict[str, Any] | None:
         """Get a page by name.
 
+        Results are cached for a few seconds so repeated lookups within one
+        tool invocation hit the API only once; writes flush the cache.
+
         Args:
             name: Page name
 
@@ -250,14 +395,17 @@ class LogseqClient:
             Page data or None if page doesn't exist
         """
         try:
-            logger.info(f"Getting page: '{name}'")
+            logger.info("Getting page", extra={"page_name": name})
             # Logseq API expects page name in an array
             result = await self._request("logseq.Editor.getPage", args=[name])
             # Logseq returns null/nil for non-existent pages
-            if result:
-                logger.info(f"Page found: {json.dumps(result)[:100]}...")
-            else:
-                logger.info(f"Page '{name}' not found (result was null/nil)")
+            if logger.isEnabledFor(logging.INFO):
+                if result:
+                    logger.info(
+                        f"Page found: {orjson.dumps(result).decode()[:100]}..."
+                    )
+                else:
+                    logger.info(f"Page '{name}' not found (result was null/nil)")
             return result if result else None
         except Exception as e:
             logger.error(f"Failed to get page '{name}': {e}")
@@ -287,6 +435,7 @@ class LogseqClient:
             # Return empty list on error instead of propagating
             return []
 
+    @async_ttl_cache(maxsize=4, ttl=30.0)
     async def get_all_pages(self) -> list[dict[str, Any]]:
         """Get all pages in the current graph.
 
@@ -296,18 +445,23 @@ class LogseqClient:
         try:
             result = await self._request("logseq.Editor.getAllPages")
             # The result should be a list of page objects
-            if isinstance(result, list):
-                return result
-            return []
+            return result if type(result) is list else []
         except Exception as e:
             logger.error(f"Failed to get all pages: {e}")
             return []
 
-    async def search_pages(self, query: str) -> list[dict[str, Any]]:
+    @async_ttl_cache(maxsize=512, ttl=30.0)
+    async def search_pages(
+        self, query: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
         """Search for pages.
 
+        The search endpoint does not paginate, so the limit is applied right
+        after parsing; callers never see (or re-slice) discarded results.
+
         Args:
             query: Search query
+            limit: Maximum number of results to return (None for all)
 
         Returns:
             List of matching pages
@@ -315,13 +469,15 @@ class LogseqClient:
         try:
             result = await self._request("logseq.Editor.search", args=query)
             # The result might be a list directly or wrapped in an object
-            if isinstance(result, list):
-                return result
-            return result.get("pages", []) if result else []
+            results = self._as_list(result, "pages")
+            if limit is not None and len(results) > limit:
+                return results[:limit]
+            return results
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    @async_ttl_cache(maxsize=512, ttl=30.0)
     async def execute_query(self, query: str) -> list[dict[str, Any]]:
         """Execute a Datalog query.
 
@@ -333,6 +489,4 @@ class LogseqClient:
         """
         result = await self._request("logseq.DB.q", args=query)
         # Handle different response formats
-        if isinstance(result, list):
-            return result
-        return result.get("results", [])
+        return self._as_list(result, "results")
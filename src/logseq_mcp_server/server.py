@@ -1,25 +1,24 @@
 """Main MCP server for Logseq integration."""
 
+import asyncio
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from typing import Any
 
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.types import Tool
 
-from .logging_config import log_tool_invocation, setup_logging
-from .logseq.client import LogseqClient
-from .tools.blocks import create_block_tool, delete_block_tool, update_block_tool
-from .tools.pages import (
-    create_page_tool,
-    get_all_pages_tool,
-    get_journal_page_tool,
-    get_page_tool,
-    search_pages_tool,
+from .logging_config import (
+    get_log_file_path,
+    log_tool_invocation,
+    setup_logging,
+    shutdown_logging,
 )
-from .tools.queries import execute_query_tool
+from .logseq.client import LogseqClient
+from .tools import TOOLS
 from .utils.date_converter import date_to_journal_format
 
 # Load environment variables
@@ -39,20 +38,33 @@ app = Server("logseq-mcp-server", version="0.1.0")
 logseq_client: LogseqClient | None = None
 
 
+def _log_handler_error(action: str, error: Exception) -> None:
+    """Log a failed tool handler invocation.
+
+    The full traceback is only formatted when DEBUG is enabled; at the
+    default INFO level the single-line message is enough and skipping
+    exc_info avoids the cost of rendering a stack per failure.
+    """
+    logger.error(
+        "Failed to %s: %s", action, error, exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+
+
+def _require_client() -> LogseqClient:
+    """Return the active Logseq client, raising if it isn't initialized.
+
+    Centralizes the guard every handler used to duplicate; handlers bind
+    the returned client to a local, avoiding repeated global reads.
+    """
+    if not logseq_client:
+        raise RuntimeError("Logseq client not initialized")
+    return logseq_client
+
+
 @app.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """Return the list of available tools."""
-    return [
-        create_block_tool,
-        update_block_tool,
-        delete_block_tool,
-        create_page_tool,
-        get_all_pages_tool,
-        get_page_tool,
-        get_journal_page_tool,
-        search_pages_tool,
-        execute_query_tool,
-    ]
+    return list(TOOLS)
 
 
 @app.call_tool()
@@ -69,19 +81,7 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Any:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
-    tool_handlers = {
-        "create_block": handle_create_block,
-        "update_block": handle_update_block,
-        "delete_block": handle_delete_block,
-        "create_page": handle_create_page,
-        "get_all_pages": handle_get_all_pages,
-        "get_page": handle_get_page,
-        "get_journal_page": handle_get_journal_page,
-        "search_pages": handle_search_pages,
-        "execute_query": handle_execute_query,
-    }
-
-    handler = tool_handlers.get(name)
+    handler = TOOL_HANDLERS.get(name)
     if not handler:
         error_msg = f"Unknown tool: {name}"
         logger.error(error_msg, extra={"tool_name": name})
@@ -112,146 +112,150 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> Any:
 
 async def handle_create_block(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle block creation."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         logger.debug(
-            f"Creating block with content: {arguments.get('content', '')[:100]}..."
+            "Creating block with content: %.100s...", arguments.get("content", "")
         )
-        result = await logseq_client.create_block(
+        result = await client.create_block(
             content=arguments["content"],
             page=arguments.get("page"),
             parent_block_id=arguments.get("parent_block_id"),
             properties=arguments.get("properties"),
         )
-        logger.debug(f"Block created successfully: {result}")
+        logger.debug("Block created successfully: %s", result)
         return {"success": True, "block": result}
     except Exception as e:
-        logger.error(f"Failed to create block: {e}", exc_info=True)
+        _log_handler_error("create block", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_update_block(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle block updates."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
-        logger.debug(f"Updating block {arguments.get('block_id')}")
-        result = await logseq_client.update_block(
+        logger.debug("Updating block %s", arguments.get("block_id"))
+        result = await client.update_block(
             block_id=arguments["block_id"],
             content=arguments.get("content"),
             properties=arguments.get("properties"),
         )
-        logger.debug(f"Block updated successfully: {result}")
+        logger.debug("Block updated successfully: %s", result)
         return {"success": True, "block": result}
     except Exception as e:
-        logger.error(f"Failed to update block: {e}", exc_info=True)
+        _log_handler_error("update block", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_delete_block(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle block deletion."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
-        logger.debug(f"Deleting block {arguments.get('block_id')}")
-        result = await logseq_client.delete_block(
+        logger.debug("Deleting block %s", arguments.get("block_id"))
+        result = await client.delete_block(
             block_id=arguments["block_id"],
         )
         logger.debug("Block deleted successfully")
         return {"success": True, "result": result}
     except Exception as e:
-        logger.error(f"Failed to delete block: {e}", exc_info=True)
+        _log_handler_error("delete block", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_create_page(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle page creation."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
-        logger.debug(f"Creating page: {arguments.get('name')}")
-        result = await logseq_client.create_page(
+        logger.debug("Creating page", extra={"page_name": arguments.get("name")})
+        result = await client.create_page(
             name=arguments["name"],
             content=arguments.get("content"),
         )
-        logger.debug(f"Page created successfully: {result}")
+        logger.debug("Page created successfully: %s", result)
         return {"success": True, "page": result}
     except Exception as e:
-        logger.error(f"Failed to create page: {e}", exc_info=True)
+        _log_handler_error("create page", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_get_all_pages(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle getting all pages."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         include_journals = arguments.get("include_journals", True)
-        logger.debug(f"Getting all pages (include_journals={include_journals})")
+        logger.debug("Getting all pages (include_journals=%s)", include_journals)
 
-        pages = await logseq_client.get_all_pages()
+        pages = await client.get_all_pages()
 
         # Filter out journal pages if requested
         if not include_journals:
             pages = [p for p in pages if not p.get("journal?", False)]
 
-        logger.debug(f"Retrieved {len(pages)} pages")
+        logger.debug("Retrieved %d pages", len(pages))
         return {"success": True, "pages": pages, "count": len(pages)}
     except Exception as e:
-        logger.error(f"Failed to get all pages: {e}", exc_info=True)
+        _log_handler_error("get all pages", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_get_page(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle page retrieval."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         page_name = arguments.get("name", "")
         if not page_name:
             return {"success": False, "error": "Page name is required"}
 
-        logger.debug(f"Getting page: {page_name}")
-        page = await logseq_client.get_page(name=page_name)
+        logger.debug("Getting page", extra={"page_name": page_name})
 
-        # Check if page exists
-        if page is None:
-            logger.debug(f"Page '{page_name}' not found")
-            return {"success": False, "error": f"Page '{page_name}' not found"}
-
-        # Only get blocks if page exists and include_children is True
         if arguments.get("include_children", True):
-            try:
-                blocks = await logseq_client.get_page_blocks(name=page_name)
-                logger.debug(
-                    f"Retrieved page with {len(blocks) if blocks else 0} blocks"
-                )
-                return {"success": True, "page": page, "blocks": blocks}
-            except Exception as block_error:
+            # Blocks don't depend on the page body, so fetch both
+            # concurrently instead of serializing two round-trips
+            page, blocks = await asyncio.gather(
+                client.get_page(name=page_name),
+                client.get_page_blocks(name=page_name),
+                return_exceptions=True,
+            )
+            if isinstance(page, Exception):
+                raise page
+
+            # Check if page exists
+            if page is None:
+                logger.debug(f"Page '{page_name}' not found")
+                return {"success": False, "error": f"Page '{page_name}' not found"}
+
+            if isinstance(blocks, Exception):
                 logger.warning(
-                    f"Failed to get blocks for page '{page_name}': {block_error}"
+                    f"Failed to get blocks for page '{page_name}': {blocks}"
                 )
                 # Return page without blocks if block retrieval fails
-                return {"success": True, "page": page, "blocks": []}
+                blocks = []
+            logger.debug("Retrieved page with %d blocks", len(blocks) if blocks else 0)
+            return {"success": True, "page": page, "blocks": blocks}
+
+        page = await client.get_page(name=page_name)
+
+        # Check if page exists
+        if page is None:
+            logger.debug(f"Page '{page_name}' not found")
+            return {"success": False, "error": f"Page '{page_name}' not found"}
 
         logger.debug("Retrieved page without blocks")
         return {"success": True, "page": page}
     except Exception as e:
-        logger.error(f"Failed to get page: {e}", exc_info=True)
+        _log_handler_error("get page", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_get_journal_page(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle journal page retrieval by date."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         date_input = arguments.get("date", "")
@@ -268,8 +272,22 @@ async def handle_get_journal_page(arguments: dict[str, Any]) -> dict[str, Any]:
             return {"success": False, "error": f"Invalid date format: {str(e)}"}
 
         # Get the journal page using the converted name
-        logger.debug(f"Getting journal page: {journal_name}")
-        page = await logseq_client.get_page(name=journal_name)
+        logger.debug("Getting journal page: %s", journal_name)
+        include_children = arguments.get("include_children", True)
+
+        if include_children:
+            # Fetch page and blocks concurrently; the blocks result is
+            # simply dropped when the page turns out to lack a uuid
+            page, blocks = await asyncio.gather(
+                client.get_page(name=journal_name),
+                client.get_page_blocks(journal_name),
+                return_exceptions=True,
+            )
+            if isinstance(page, Exception):
+                raise page
+        else:
+            page = await client.get_page(name=journal_name)
+            blocks = None
 
         # Check if page exists
         if page is None:
@@ -277,80 +295,81 @@ async def handle_get_journal_page(arguments: dict[str, Any]) -> dict[str, Any]:
             logger.info(f"Tried to find journal page with name: '{journal_name}' for date input: '{date_input}'")
             return {"success": False, "page": None, "journal_name": journal_name}
 
-        logger.debug(f"Retrieved journal page: {page.get('uuid')}")
+        logger.debug("Retrieved journal page: %s", page.get("uuid"))
 
-        # Get child blocks if requested
-        include_children = arguments.get("include_children", True)
+        # Include child blocks if requested
         if include_children and page.get("uuid"):
-            try:
-                logger.debug("Getting blocks for journal page")
-                blocks = await logseq_client.get_page_blocks(journal_name)
-                return {
-                    "success": True,
-                    "page": page,
-                    "blocks": blocks,
-                    "journal_name": journal_name,
-                }
-            except Exception as block_error:
+            if isinstance(blocks, Exception):
                 logger.warning(
-                    f"Failed to get blocks for journal page '{journal_name}': {block_error}"
+                    f"Failed to get blocks for journal page '{journal_name}': {blocks}"
                 )
                 # Return page without blocks if block retrieval fails
-                return {
-                    "success": True,
-                    "page": page,
-                    "blocks": [],
-                    "journal_name": journal_name,
-                }
+                blocks = []
+            return {
+                "success": True,
+                "page": page,
+                "blocks": blocks,
+                "journal_name": journal_name,
+            }
 
         logger.debug("Retrieved journal page without blocks")
         return {"success": True, "page": page, "journal_name": journal_name}
     except Exception as e:
-        logger.error(f"Failed to get journal page: {e}", exc_info=True)
+        _log_handler_error("get journal page", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_search_pages(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle page search."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         query = arguments.get("query", "")
-        logger.debug(f"Searching pages with query: {query}")
-        results = await logseq_client.search_pages(
+        logger.debug("Searching pages", extra={"search_query": query})
+        results = await client.search_pages(
             query=arguments["query"],
+            limit=arguments.get("limit", 10),
         )
-        # Limit results if specified
-        limit = arguments.get("limit", 10)
-        if limit and len(results) > limit:
-            results = results[:limit]
-
-        logger.debug(f"Found {len(results)} pages matching query")
+        logger.debug("Found %d pages matching query", len(results))
         return {"success": True, "results": results, "count": len(results)}
     except Exception as e:
-        logger.error(f"Failed to search pages: {e}", exc_info=True)
+        _log_handler_error("search pages", e)
         return {"success": False, "error": str(e)}
 
 
 async def handle_execute_query(arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle Datalog query execution."""
-    if not logseq_client:
-        raise RuntimeError("Logseq client not initialized")
+    client = _require_client()
 
     try:
         query = arguments.get("query", "")
-        logger.debug(f"Executing Datalog query: {query[:200]}...")
-        results = await logseq_client.execute_query(
+        logger.debug("Executing Datalog query", extra={"datalog_query": query})
+        results = await client.execute_query(
             query=arguments["query"],
         )
-        logger.debug(f"Query returned {len(results)} results")
+        logger.debug("Query returned %d results", len(results))
         return {"success": True, "results": results, "count": len(results)}
     except Exception as e:
-        logger.error(f"Failed to execute query: {e}", exc_info=True)
+        _log_handler_error("execute query", e)
         return {"success": False, "error": str(e)}
 
 
+# Tool handlers keyed by name, built once at import; dispatch in
+# handle_call_tool is a single dict lookup. The tool definitions
+# themselves live in the tools package (TOOLS).
+TOOL_HANDLERS: dict[str, Any] = {
+    "create_block": handle_create_block,
+    "update_block": handle_update_block,
+    "delete_block": handle_delete_block,
+    "create_page": handle_create_page,
+    "get_all_pages": handle_get_all_pages,
+    "get_page": handle_get_page,
+    "get_journal_page": handle_get_journal_page,
+    "search_pages": handle_search_pages,
+    "execute_query": handle_execute_query,
+}
+
+
 async def initialize_logseq_client():
     """Initialize the Logseq client."""
     global logseq_client
@@ -387,6 +406,22 @@ async def cleanup():
     if logseq_client:
         await logseq_client.close()
         logseq_client = None
+    shutdown_logging()
+
+
+@asynccontextmanager
+async def lifespan():
+    """Bind the Logseq client lifecycle to the server's run scope.
+
+    The connection pool is created once on entry and drained on exit, so
+    every transport gets the same setup/teardown instead of relying on
+    ad-hoc initialize/cleanup calls.
+    """
+    await initialize_logseq_client()
+    try:
+        yield logseq_client
+    finally:
+        await cleanup()
 
 
 async def main():
@@ -394,27 +429,22 @@ async def main():
     logger.info("Starting Logseq MCP server")
     logger.info(f"Server version: {app.name} v{app.version}")
 
-    # Log file location
-    for handler in logging.getLogger().handlers:
-        if hasattr(handler, "baseFilename"):
-            # Use getattr to safely access the attribute
-            filename = getattr(handler, "baseFilename", None)
-            if filename:
-                logger.info(f"Log file location: {filename}")
-            break
+    # Log file location; the file handler sits behind the queue listener,
+    # so ask logging_config rather than probing the root logger's handlers
+    log_file_path = get_log_file_path()
+    if log_file_path:
+        logger.info(f"Log file location: {log_file_path}")
     else:
         logger.info("Logging to console only (no file handler)")
 
     from mcp.server.stdio import stdio_server
 
-    # Initialize Logseq client before starting server
-    await initialize_logseq_client()
-
     transport = os.getenv("LOGSEQ_MCP_TRANSPORT", "stdio")
     logger.info(f"Using transport: {transport}")
 
     if transport == "stdio":
-        async with stdio_server() as (read_stream, write_stream):
+        # Client pool lives exactly as long as the server run
+        async with lifespan(), stdio_server() as (read_stream, write_stream):
             try:
                 logger.debug("Creating initialization options")
                 initialization_options = app.create_initialization_options()
@@ -429,7 +459,6 @@ async def main():
                 raise
             finally:
                 logger.info("Shutting down server")
-                await cleanup()
     else:
         # TODO: Implement SSE transport
         error_msg = f"Transport {transport} not implemented"
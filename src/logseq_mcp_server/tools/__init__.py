@@ -9,3 +9,29 @@ Modules:
 - pages: Tools for page management and retrieval
 - queries: Tools for executing Datalog queries
 """
+
+from mcp.types import Tool
+
+from .blocks import create_block_tool, delete_block_tool, update_block_tool
+from .pages import (
+    create_page_tool,
+    get_all_pages_tool,
+    get_journal_page_tool,
+    get_page_tool,
+    search_pages_tool,
+)
+from .queries import execute_query_tool
+
+# All tool definitions, built once at import. The server returns this
+# tuple from list_tools instead of rebuilding a list per call.
+TOOLS: tuple[Tool, ...] = (
+    create_block_tool,
+    update_block_tool,
+    delete_block_tool,
+    create_page_tool,
+    get_all_pages_tool,
+    get_page_tool,
+    get_journal_page_tool,
+    search_pages_tool,
+    execute_query_tool,
+)
@@ -2,6 +2,16 @@
 
 from mcp.types import Tool
 
+# Sub-schemas repeated across tool definitions, built once and shared
+# by reference. Plain dicts (not MappingProxyType) because the schemas
+# must stay JSON-serializable for the wire; nothing mutates them after
+# import.
+_INCLUDE_CHILDREN_PROP = {
+    "type": "boolean",
+    "description": "Whether to include child blocks",
+    "default": True,
+}
+
 get_all_pages_tool = Tool(
     name="get_all_pages",
     description="Get all pages in the current Logseq graph",
@@ -46,11 +56,7 @@ get_page_tool = Tool(
                 "type": "string",
                 "description": "The name of the page to retrieve",
             },
-            "include_children": {
-                "type": "boolean",
-                "description": "Whether to include child blocks",
-                "default": True,
-            },
+            "include_children": _INCLUDE_CHILDREN_PROP,
         },
         "required": ["name"],
     },
@@ -86,11 +92,7 @@ get_journal_page_tool = Tool(
                 "type": "string",
                 "description": "The date for the journal page. Accepts various formats: ISO (2023-12-25), US (12/25/2023), or already formatted (December 25th, 2023)",
             },
-            "include_children": {
-                "type": "boolean",
-                "description": "Whether to include child blocks",
-                "default": True,
-            },
+            "include_children": _INCLUDE_CHILDREN_PROP,
         },
         "required": ["date"],
     },
@@ -6,6 +6,122 @@ Logseq's journal page naming format.
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
+
+# Compiled once at import; both functions sit on the get_journal_page
+# hot path and would otherwise re-probe the re module cache per call.
+_JOURNAL_FMT_RE = re.compile(r"^[A-Za-z]{3} \d{1,2}(?:st|nd|rd|th), \d{4}$")
+
+# Single-pass parser for journal names (ordinal suffix optional), used
+# by journal_format_to_date instead of an ordinal-stripping sub plus
+# strptime round-trip.
+_JRNL_RE = re.compile(r"^([A-Z][a-z]{2}) (\d{1,2})(?:st|nd|rd|th)?, (\d{4})$")
+
+# One match classifies every numeric date shape (ISO, US/EU, compact)
+# instead of probing strptime formats by exception. The separator is
+# backreferenced so mixed "-"/"/" inputs are rejected, matching the old
+# per-format behavior. Month-name formats still go through strptime.
+_NUMERIC_DATE_RE = re.compile(
+    r"^(?:"
+    r"(?P<iso_y>\d{4})(?P<iso_sep>[-/])(?P<iso_m>\d{1,2})(?P=iso_sep)(?P<iso_d>\d{1,2})"
+    r"|(?P<dm_a>\d{1,2})(?P<dm_sep>[-/])(?P<dm_b>\d{1,2})(?P=dm_sep)(?P<dm_y>\d{4})"
+    r"|(?P<compact>\d{8})"
+    r")$"
+)
+
+_MONTH_NAME_FORMATS = (
+    "%B %d, %Y",  # Full month name
+    "%b %d, %Y",  # Abbreviated month
+)
+
+# Ordinal suffix for each day of the month, indexed by day (index 0
+# unused). A tuple index replaces the modulo/compare/dict-get dance on
+# every formatted date.
+_SUFFIXES = tuple(
+    "th" if 10 <= d % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(d % 10, "th")
+    for d in range(32)
+)
+
+# Logseq journal names use English month abbreviations regardless of
+# locale; a tuple lookup keeps formatting locale-independent and skips
+# strftime entirely. Index 0 unused.
+_MONTH_ABBR = (
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+_MONTH_TO_NUM = {name: num for num, name in enumerate(_MONTH_ABBR) if num}
+
+
+def _parse_date_str(date_str: str) -> date:
+    """Parse a date string into a date object.
+
+    Dispatches on a single regex match for the numeric shapes; only
+    month-name inputs fall back to strptime. Ambiguous two-digit pairs
+    are tried US-first (month/day) then EU (day/month), preserving the
+    precedence of the old format-probe loop.
+
+    Raises:
+        ValueError: If the string matches no supported format or the
+            captured fields are out of range (e.g. month 13).
+    """
+    m = _NUMERIC_DATE_RE.match(date_str)
+    if m is not None:
+        if m.group("iso_y"):
+            return date(int(m.group("iso_y")), int(m.group("iso_m")), int(m.group("iso_d")))
+        if m.group("compact"):
+            return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+        a, b, y = int(m.group("dm_a")), int(m.group("dm_b")), int(m.group("dm_y"))
+        try:
+            return date(y, a, b)  # US: month/day
+        except ValueError:
+            return date(y, b, a)  # EU: day/month
+
+    for fmt in _MONTH_NAME_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+
+    raise ValueError(f"Cannot parse date: {date_str}")
+
+
+def _format_date(dt: date) -> str:
+    """Format a date object as a Logseq journal page name."""
+    # Format: "Dec 25th, 2023" (abbreviated month)
+    day = dt.day
+    return f"{_MONTH_ABBR[dt.month]} {day}{_SUFFIXES[day]}, {dt.year}"
+
+
+@lru_cache(maxsize=512)
+def _str_to_journal_format(date_str: str) -> str:
+    """Parse a date string and format it as a journal page name.
+
+    Memoized: string parsing is pure and the same journal names recur
+    many times per session, so repeat lookups skip the format-probing
+    loop entirely. Failed conversions raise and are never cached.
+    """
+    # Check if already in journal format (abbreviated month)
+    if _JOURNAL_FMT_RE.match(date_str):
+        return date_str
+
+    try:
+        dt = _parse_date_str(date_str)
+    except ValueError:
+        raise ValueError(f"Cannot parse date: {date_str}") from None
+
+    return _format_date(dt)
 
 
 def date_to_journal_format(input_date: str | date | datetime) -> str:
@@ -27,6 +143,9 @@ def date_to_journal_format(input_date: str | date | datetime) -> str:
     Raises:
         ValueError: If the date format cannot be parsed
 
+    String parsing is memoized (see ``_str_to_journal_format``); date and
+    datetime objects are formatted directly without touching the cache.
+
     Examples:
         >>> date_to_journal_format("2023-12-25")
         "Dec 25th, 2023"
@@ -39,53 +158,11 @@ def date_to_journal_format(input_date: str | date | datetime) -> str:
     """
     # If already a date/datetime object
     if isinstance(input_date, datetime):
-        dt = input_date.date()
-    elif isinstance(input_date, date):
-        dt = input_date
-    else:
-        # Try to parse string input
-        date_str = str(input_date).strip()
-
-        # Check if already in journal format (abbreviated month)
-        journal_pattern = r"^[A-Za-z]{3} \d{1,2}(st|nd|rd|th), \d{4}$"
-        if re.match(journal_pattern, date_str):
-            return date_str
-
-        # Try various date formats
-        formats = [
-            "%Y-%m-%d",  # ISO format
-            "%Y/%m/%d",  # Alternative ISO
-            "%m/%d/%Y",  # US format
-            "%d/%m/%Y",  # EU format
-            "%m-%d-%Y",  # US with dashes
-            "%d-%m-%Y",  # EU with dashes
-            "%Y%m%d",  # Compact format
-            "%B %d, %Y",  # Full month name
-            "%b %d, %Y",  # Abbreviated month
-        ]
-
-        dt = None
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt).date()
-                break
-            except ValueError:
-                continue
-
-        if dt is None:
-            raise ValueError(f"Cannot parse date: {input_date}")
-
-    # Format to Logseq journal format
-    day = dt.day
-
-    # Add ordinal suffix
-    if 10 <= day % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+        return _format_date(input_date.date())
+    if isinstance(input_date, date):
+        return _format_date(input_date)
 
-    # Format: "Dec 25th, 2023" (abbreviated month)
-    return dt.strftime(f"%b {day}{suffix}, %Y")
+    return _str_to_journal_format(str(input_date).strip())
 
 
 def journal_format_to_date(journal_name: str) -> date:
@@ -104,13 +181,14 @@ def journal_format_to_date(journal_name: str) -> date:
         >>> journal_format_to_date("Dec 25th, 2023")
         datetime.date(2023, 12, 25)
     """
-    import re
-
-    # Remove ordinal suffixes
-    cleaned = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", journal_name)
+    # One regex pass extracts month, day, and year (ordinal optional);
+    # no intermediate suffix-stripped string or strptime round-trip
+    m = _JRNL_RE.match(journal_name)
+    if not m:
+        raise ValueError(f"Cannot parse journal format: {journal_name}")
 
-    # Parse the cleaned date (abbreviated month format)
+    month_name, day, year = m.groups()
     try:
-        return datetime.strptime(cleaned, "%b %d, %Y").date()
-    except ValueError as e:
+        return date(int(year), _MONTH_TO_NUM[month_name], int(day))
+    except (KeyError, ValueError) as e:
         raise ValueError(f"Cannot parse journal format: {journal_name}") from e
@@ -5,40 +5,31 @@ from .date_converter import date_to_journal_format as original_converter
 
 
 def date_to_journal_format_abbreviated(input_date: str | date | datetime) -> str:
-    """Convert date to abbreviated month format (e.g., 'Aug 1st, 2025')."""
-    # First get the standard format
-    full_format = original_converter(input_date)
-    
-    # Convert to abbreviated month
-    month_map = {
-        "January": "Jan", "February": "Feb", "March": "Mar",
-        "April": "Apr", "May": "May", "June": "Jun",
-        "July": "Jul", "August": "Aug", "September": "Sep",
-        "October": "Oct", "November": "Nov", "December": "Dec"
-    }
-    
-    for full, abbr in month_map.items():
-        if full_format.startswith(full):
-            return full_format.replace(full, abbr, 1)
-    
-    return full_format
+    """Convert date to abbreviated month format (e.g., 'Aug 1st, 2025').
+
+    The base converter already emits abbreviated month names, so this is
+    a straight delegation; the old full-to-abbreviated replacement loop
+    scanned twelve month names per call for nothing.
+    """
+    return original_converter(input_date)
 
 
 def try_multiple_journal_formats(input_date: str | date | datetime) -> list[str]:
-    """Generate multiple possible journal formats to try."""
+    """Generate multiple possible journal formats to try.
+
+    The converter is called once (the abbreviated variant would return
+    the identical string) and unparseable input only suppresses the
+    converted form, not the raw-string fallback.
+    """
     formats = []
-    
+
     try:
-        # Full month name
         formats.append(original_converter(input_date))
-        
-        # Abbreviated month
-        formats.append(date_to_journal_format_abbreviated(input_date))
-        
-        # If it's already a string that looks like a date
-        if isinstance(input_date, str):
-            formats.append(input_date)
-    except:
+    except ValueError:
         pass
-    
+
+    # If it's already a string that looks like a date
+    if isinstance(input_date, str) and input_date not in formats:
+        formats.append(input_date)
+
     return formats
\ No newline at end of file
@@ -13,10 +13,155 @@ Example:
     '[content_19_chars]'
 """
 
-import hashlib
 import re
-from pathlib import Path
-from typing import Any, Dict, Optional, Union
+import zlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Patterns compiled once at import; the sanitizer sits on the hot log
+# path, so per-call re.match/re.sub cache probes add up.
+_JOURNAL_RE = re.compile(r"^\w+\s+\d+\w*,\s+\d{4}$")
+_URL_RE = re.compile(r"https?://([^/]+)")
+# One alternation covering home directories (Unix and Windows) and
+# graph names, so sanitize_path scans the string once instead of
+# running six sequential substitutions. The replacement is dispatched
+# on which named branch matched.
+_PATH_RE = re.compile(
+    r"(?P<home>/home/[^/]+)"
+    r"|(?P<users>/Users/[^/]+)"
+    r"|(?P<winusers>\\Users\\[^\\]+)"
+    r"|(?P<graphs>/graphs/[^/]+)"
+    r"|(?P<wingraphs>\\graphs\\[^\\]+)",
+    re.IGNORECASE,
+)
+_PATH_REPL = {
+    "home": "/home/***",
+    "users": "/Users/***",
+    "winusers": "\\Users\\***",
+    "graphs": "/graphs/***",
+    "wingraphs": "\\graphs\\***",
+}
+
+
+def _path_repl(match: "re.Match[str]") -> str:
+    return _PATH_REPL[match.lastgroup]
+
+
+# Property keys that should always be redacted / partially shown. Most
+# real keys match exactly, so sanitize_properties checks set membership
+# first and only falls back to the substring sweep on a miss.
+_SENSITIVE_KEYS = frozenset(
+    {
+        "password",
+        "token",
+        "secret",
+        "key",
+        "api_key",
+        "email",
+        "phone",
+        "ssn",
+        "credit_card",
+    }
+)
+_PARTIAL_KEYS = frozenset({"url", "link", "website", "domain"})
+
+_KEY_NEITHER, _KEY_SENSITIVE, _KEY_PARTIAL = 0, 1, 2
+
+
+@lru_cache(maxsize=4096)
+def _classify_key(key: str) -> int:
+    """Classify a property key as sensitive, partially shown, or neither.
+
+    Memoized: property dicts repeat the same keys all session, so the
+    lowercase plus set/substring scans run once per distinct key.
+    """
+    lower_key = key.lower()
+    if lower_key in _SENSITIVE_KEYS or any(
+        sensitive in lower_key for sensitive in _SENSITIVE_KEYS
+    ):
+        return _KEY_SENSITIVE
+    if lower_key in _PARTIAL_KEYS or any(
+        partial in lower_key for partial in _PARTIAL_KEYS
+    ):
+        return _KEY_PARTIAL
+    return _KEY_NEITHER
+
+# Pre-rendered "[content_N_chars]" strings for typical content lengths;
+# log lines repeat the same lengths constantly, and an index into this
+# table beats formatting a fresh string each time.
+_CONTENT_LEN_STRS = tuple(f"[content_{n}_chars]" for n in range(4097))
+
+# Default sanitize_dict rules, allocated once and read-only so callers
+# can't mutate the shared mapping.
+_DEFAULT_RULES = MappingProxyType(
+    {
+        "page_name": "page_name",
+        "page": "page_name",
+        "name": "page_name",
+        "content": "content",
+        "block_content": "content",
+        "path": "path",
+        "file_path": "path",
+        "properties": "properties",
+        "query": "query",
+        "block_id": "block_id",
+        "uuid": "block_id",
+    }
+)
+
+
+# Cached implementations of the pure string sanitizations. The same
+# page names, paths, and block UUIDs recur throughout a session, so a
+# dict hit replaces the regex/hash work. Module-level functions keyed on
+# the value (plus the one relevant setting) rather than methods, so
+# `self` doesn't poison the cache key.
+
+
+@lru_cache(maxsize=512)
+def _fmt_query_len(n: int) -> str:
+    """Render the query-length placeholder once per distinct length."""
+    return f"[datalog_query_{n}_chars]"
+
+
+@lru_cache(maxsize=2048)
+def _mask_page_name(name: str, min_mask_length: int) -> str:
+    if len(name) <= min_mask_length:
+        return name
+
+    # For journal pages, just indicate it's a journal. The cheap
+    # length/comma pre-test rejects almost every ordinary page name
+    # before the regex engine runs (the pattern needs >= 9 chars and
+    # always contains a comma).
+    if len(name) >= 9 and "," in name and _JOURNAL_RE.match(name):
+        return "[journal_page]"
+
+    # Mask middle portion of the name
+    visible_chars = max(1, len(name) // 4)
+    if len(name) <= 8:
+        # Short names: show first and last char
+        return f"{name[0]}***{name[-1]}"
+    else:
+        # Longer names: show more context
+        start = name[:visible_chars]
+        end = name[-visible_chars:]
+        return f"{start}***{end}"
+
+
+@lru_cache(maxsize=2048)
+def _mask_block_id(block_id: str) -> str:
+    # Short non-cryptographic hash: the tag only needs to be
+    # deterministic for log correlation, not collision-resistant,
+    # and crc32 is far cheaper than sha256 per log line.
+    return f"block_{zlib.crc32(block_id.encode()) & 0xFFFFFF:06x}"
+
+
+@lru_cache(maxsize=2048)
+def _mask_path(path_str: str) -> str:
+    return _PATH_RE.sub(_path_repl, path_str)
 
 
 class LogSanitizer:
@@ -40,6 +185,12 @@ class LogSanitizer:
                            Defaults to 3 to avoid masking very short strings.
         """
         self.min_mask_length = min_mask_length
+        # Default rules pre-resolved to bound methods once, so the hot
+        # sanitize_dict path skips per-key getattr/hasattr dispatch.
+        self._default_rule_methods = {
+            key: getattr(self, f"sanitize_{rule}")
+            for key, rule in _DEFAULT_RULES.items()
+        }
 
     def sanitize_page_name(self, name: Optional[str]) -> str:
         """Partially mask page names to protect privacy.
@@ -68,23 +219,7 @@ class LogSanitizer:
         if not name:
             return "[empty]"
 
-        if len(name) <= self.min_mask_length:
-            return name
-
-        # For journal pages, just indicate it's a journal
-        if re.match(r"^\w+\s+\d+\w*,\s+\d{4}$", name):
-            return "[journal_page]"
-
-        # Mask middle portion of the name
-        visible_chars = max(1, len(name) // 4)
-        if len(name) <= 8:
-            # Short names: show first and last char
-            return f"{name[0]}***{name[-1]}"
-        else:
-            # Longer names: show more context
-            start = name[:visible_chars]
-            end = name[-visible_chars:]
-            return f"{start}***{end}"
+        return _mask_page_name(name, self.min_mask_length)
 
     def sanitize_content(self, content: Optional[str]) -> str:
         """Replace content with length indicator.
@@ -97,7 +232,8 @@ class LogSanitizer:
             return "[empty]"
 
         # Just return length info, no content
-        return f"[content_{len(content)}_chars]"
+        n = len(content)
+        return _CONTENT_LEN_STRS[n] if n <= 4096 else f"[content_{n}_chars]"
 
     def sanitize_block_id(self, block_id: Optional[str]) -> str:
         """Anonymize block IDs while keeping them traceable.
@@ -108,12 +244,9 @@ class LogSanitizer:
         if not block_id:
             return "[empty]"
 
-        # Create a short hash for correlation without revealing actual ID
-        hash_obj = hashlib.sha256(block_id.encode())
-        short_hash = hash_obj.hexdigest()[:6]
-        return f"block_{short_hash}"
+        return _mask_block_id(block_id)
 
-    def sanitize_path(self, path: Optional[Union[str, Path]]) -> str:
+    def sanitize_path(self, path: Optional[Union[str, "Path"]]) -> str:
         """Mask username and sensitive parts in file paths.
 
         Examples:
@@ -123,26 +256,7 @@ class LogSanitizer:
         if not path:
             return "[empty]"
 
-        path_str = str(path)
-
-        # Common patterns to mask
-        patterns = [
-            # Unix home directories
-            (r"/home/([^/]+)", r"/home/***"),
-            (r"/Users/([^/]+)", r"/Users/***"),
-            # Windows paths
-            (r"C:\\Users\\([^\\]+)", r"C:\\Users\\***"),
-            (r"\\Users\\([^\\]+)", r"\\Users\\***"),
-            # Graph names (often sensitive)
-            (r"/graphs/([^/]+)", r"/graphs/***"),
-            (r"\\graphs\\([^\\]+)", r"\\graphs\\***"),
-        ]
-
-        sanitized = path_str
-        for pattern, replacement in patterns:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-
-        return sanitized
+        return _mask_path(str(path))
 
     def sanitize_properties(
         self, properties: Optional[Dict[str, Any]]
@@ -154,32 +268,16 @@ class LogSanitizer:
         if not properties:
             return {}
 
-        # Keys that should always be redacted
-        sensitive_keys = {
-            "password",
-            "token",
-            "secret",
-            "key",
-            "api_key",
-            "email",
-            "phone",
-            "ssn",
-            "credit_card",
-        }
-
-        # Keys that can be partially shown
-        partial_keys = {"url", "link", "website", "domain"}
-
         sanitized = {}
         for key, value in properties.items():
-            lower_key = key.lower()
+            kind = _classify_key(key)
 
-            if any(sensitive in lower_key for sensitive in sensitive_keys):
+            if kind == _KEY_SENSITIVE:
                 sanitized[key] = "[REDACTED]"
-            elif any(partial in lower_key for partial in partial_keys):
+            elif kind == _KEY_PARTIAL:
                 if isinstance(value, str) and len(value) > 10:
                     # Show domain for URLs
-                    domain_match = re.search(r"https?://([^/]+)", value)
+                    domain_match = _URL_RE.search(value)
                     if domain_match:
                         sanitized[key] = f"{domain_match.group(1)}/***"
                     else:
@@ -189,8 +287,13 @@ class LogSanitizer:
             elif isinstance(value, str) and len(value) > 50:
                 # Long string values might be sensitive
                 sanitized[key] = f"[string_{len(value)}_chars]"
-            elif isinstance(value, (list, dict)) and len(str(value)) > 100:
-                # Complex values
+            elif isinstance(value, (list, dict)) and (
+                len(value) > 10 or len(str(value)) > 100
+            ):
+                # Complex values: item count is a cheap first test that
+                # skips stringifying big containers, but a small container
+                # can still hide long (potentially sensitive) strings, so
+                # small ones fall back to the character budget
                 sanitized[key] = f"[{type(value).__name__}_with_{len(value)}_items]"
             else:
                 # Keep non-sensitive values
@@ -209,7 +312,7 @@ class LogSanitizer:
             return "[empty]"
 
         # Queries can reveal search patterns, so just show type and length
-        return f"[datalog_query_{len(query)}_chars]"
+        return _fmt_query_len(len(query))
 
     def sanitize_dict(
         self, data: Dict[str, Any], rules: Optional[Dict[str, str]] = None
@@ -237,43 +340,49 @@ class LogSanitizer:
             {'page_name': 'Se***ge', 'count': 42}
         """
         if not rules:
-            rules = {
-                "page_name": "page_name",
-                "page": "page_name",
-                "name": "page_name",
-                "content": "content",
-                "block_content": "content",
-                "path": "path",
-                "file_path": "path",
-                "properties": "properties",
-                "query": "query",
-                "block_id": "block_id",
-                "uuid": "block_id",
+            methods = self._default_rule_methods
+        else:
+            # Resolve custom rules to bound methods once per call;
+            # unknown method names map to None (value passes through).
+            methods = {
+                key: getattr(self, f"sanitize_{rule}", None)
+                for key, rule in rules.items()
             }
 
-        sanitized = {}
-        for key, value in data.items():
-            if key in rules and not isinstance(value, (dict, list)):
-                # Apply rule only if value is not a complex type
-                method_name = f"sanitize_{rules[key]}"
-                if hasattr(self, method_name):
-                    method = getattr(self, method_name)
-                    sanitized[key] = method(value)
-                else:
-                    sanitized[key] = value
-            elif isinstance(value, dict):
-                # Recursively sanitize nested dicts
-                sanitized[key] = self.sanitize_dict(value, rules)
-            elif isinstance(value, list) and len(value) > 0:
-                # For lists, sanitize if items are dicts
-                if isinstance(value[0], dict):
-                    sanitized[key] = [self.sanitize_dict(item, rules) for item in value]
+        # Explicit work stack instead of recursion: nested dicts and
+        # lists of dicts get an empty output container pushed for later
+        # filling, so deep results cost no Python stack frames.
+        sanitized: Dict[str, Any] = {}
+        stack = [(data, sanitized)]
+        while stack:
+            src, dst = stack.pop()
+            for key, value in src.items():
+                if not isinstance(value, (dict, list)):
+                    if key in methods:
+                        # Apply rule only if value is not a complex type
+                        method = methods[key]
+                        dst[key] = method(value) if method is not None else value
+                    elif isinstance(value, (str, int, float, bool, type(None))):
+                        # Keep non-sensitive simple data
+                        dst[key] = value
+                    else:
+                        dst[key] = f"[{type(value).__name__}]"
+                elif isinstance(value, dict):
+                    child: Dict[str, Any] = {}
+                    dst[key] = child
+                    stack.append((value, child))
+                elif len(value) > 0:
+                    # For lists, sanitize if items are dicts
+                    if isinstance(value[0], dict):
+                        children = []
+                        dst[key] = children
+                        for item in value:
+                            child = {}
+                            children.append(child)
+                            stack.append((item, child))
+                    else:
+                        dst[key] = f"[list_with_{len(value)}_items]"
                 else:
-                    sanitized[key] = f"[list_with_{len(value)}_items]"
-            elif isinstance(value, (str, int, float, bool, type(None))):
-                # Keep non-sensitive simple data
-                sanitized[key] = value
-            else:
-                sanitized[key] = f"[{type(value).__name__}]"
+                    dst[key] = f"[{type(value).__name__}]"
 
         return sanitized
@@ -2,24 +2,49 @@
 
 import json
 from datetime import date, datetime
-from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from logseq_mcp_server.server import handle_get_journal_page
+from tests.conftest import FakeLogseqClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_logseq_client():
-    """Create a mock Logseq client."""
-    client = AsyncMock()
-    return client
+    """Create a fake Logseq client, shared across the session.
+
+    The hand-rolled stub is far cheaper to build than an AsyncMock; one
+    instance serves the whole session and is wiped between tests by the
+    autouse reset fixture below.
+    """
+    return FakeLogseqClient()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_logseq_client):
+    """Clear recorded calls and configuration before every test."""
+    mock_logseq_client.reset()
+
+
+@pytest.fixture(autouse=True)
+def _patched_client(request, monkeypatch, mock_logseq_client):
+    """Install the fake client as the server's module global.
+
+    monkeypatch is two plain attribute writes per test, far cheaper
+    than re-entering unittest.mock.patch in every test body. Tests that
+    need the unpatched (None) global opt out with the
+    no_patched_client marker.
+    """
+    if "no_patched_client" in request.keywords:
+        return
+    monkeypatch.setattr("logseq_mcp_server.server.logseq_client", mock_logseq_client)
 
 
 class TestGetJournalPageTool:
     """Test get_journal_page tool integration."""
-    
-    @pytest.mark.asyncio
+
+    pytestmark = pytest.mark.handlers
+
     async def test_get_journal_page_success(self, mock_logseq_client):
         """Test successful journal page retrieval."""
         # Mock response
@@ -35,67 +60,62 @@ class TestGetJournalPageTool:
         ]
         
         mock_logseq_client.get_page.return_value = mock_page
-        mock_logseq_client.get_page_blocks_tree.return_value = mock_blocks
-        
-        # Patch the global client
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({
-                "date": "2023-12-25",
-                "include_children": True
-            })
-        
+        mock_logseq_client.get_page_blocks.return_value = mock_blocks
+
+        result = await handle_get_journal_page({
+            "date": "2023-12-25",
+            "include_children": True
+        })
+
         assert result["success"] is True
         assert result["page"] == mock_page
         assert result["blocks"] == mock_blocks
         assert result["journal_name"] == "Dec 25th, 2023"
-        
+
         # Verify the client was called with the converted journal name
         mock_logseq_client.get_page.assert_called_once_with(name="Dec 25th, 2023")
-        mock_logseq_client.get_page_blocks_tree.assert_called_once_with("test-uuid-123")
+        mock_logseq_client.get_page_blocks.assert_called_once_with("Dec 25th, 2023")
     
-    @pytest.mark.asyncio
-    async def test_get_journal_page_various_date_formats(self, mock_logseq_client):
-        """Test journal page retrieval with various date formats."""
-        mock_page = {"uuid": "test-uuid", "originalName": "Dec 25th, 2023"}
-        mock_logseq_client.get_page.return_value = mock_page
-        mock_logseq_client.get_page_blocks_tree.return_value = []
-        
-        test_cases = [
+    @pytest.mark.parametrize(
+        "date_input,expected_journal",
+        [
             ("2023-12-25", "Dec 25th, 2023"),  # ISO format
             ("12/25/2023", "Dec 25th, 2023"),  # US format
             ("Dec 25th, 2023", "Dec 25th, 2023"),  # Already formatted
-        ]
-        
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            for date_input, expected_journal in test_cases:
-                result = await handle_get_journal_page({"date": date_input})
-                
-                assert result["success"] is True
-                assert result["journal_name"] == expected_journal
+        ],
+    )
+    async def test_get_journal_page_various_date_formats(
+        self, mock_logseq_client, date_input, expected_journal
+    ):
+        """Test journal page retrieval with various date formats."""
+        mock_page = {"uuid": "test-uuid", "originalName": "Dec 25th, 2023"}
+        mock_logseq_client.get_page.return_value = mock_page
+        mock_logseq_client.get_page_blocks.return_value = []
+
+        result = await handle_get_journal_page({"date": date_input})
+
+        assert result["success"] is True
+        assert result["journal_name"] == expected_journal
     
-    @pytest.mark.asyncio
     async def test_get_journal_page_not_found(self, mock_logseq_client):
         """Test journal page not found."""
         mock_logseq_client.get_page.return_value = None
         
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({"date": "2023-12-25"})
+        result = await handle_get_journal_page({"date": "2023-12-25"})
         
         assert result["success"] is False
         assert result["page"] is None
         assert result["journal_name"] == "Dec 25th, 2023"
     
-    @pytest.mark.asyncio
     async def test_get_journal_page_without_children(self, mock_logseq_client):
         """Test getting journal page without child blocks."""
         mock_page = {"uuid": "test-uuid", "originalName": "Dec 25th, 2023"}
         mock_logseq_client.get_page.return_value = mock_page
         
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({
-                "date": "2023-12-25",
-                "include_children": False
-            })
+        result = await handle_get_journal_page({
+            "date": "2023-12-25",
+            "include_children": False
+        })
         
         assert result["success"] is True
         assert result["page"] == mock_page
@@ -103,38 +123,32 @@ class TestGetJournalPageTool:
         assert result["journal_name"] == "Dec 25th, 2023"
         
         # Verify blocks were not fetched
-        mock_logseq_client.get_page_blocks_tree.assert_not_called()
+        mock_logseq_client.get_page_blocks.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_get_journal_page_invalid_date_format(self, mock_logseq_client):
         """Test journal page with invalid date format."""
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({"date": "not a date"})
+        result = await handle_get_journal_page({"date": "not a date"})
         
         assert result["success"] is False
         assert "Invalid date format" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_get_journal_page_missing_date(self, mock_logseq_client):
         """Test journal page without date parameter."""
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({})
+        result = await handle_get_journal_page({})
         
         assert result["success"] is False
         assert result["error"] == "Date is required"
     
-    @pytest.mark.asyncio
     async def test_get_journal_page_block_retrieval_failure(self, mock_logseq_client):
         """Test handling of block retrieval failure."""
         mock_page = {"uuid": "test-uuid", "originalName": "Dec 25th, 2023"}
         mock_logseq_client.get_page.return_value = mock_page
-        mock_logseq_client.get_page_blocks_tree.side_effect = Exception("API error")
+        mock_logseq_client.get_page_blocks.side_effect = Exception("API error")
         
-        with patch("logseq_mcp_server.server.logseq_client", mock_logseq_client):
-            result = await handle_get_journal_page({
-                "date": "2023-12-25",
-                "include_children": True
-            })
+        result = await handle_get_journal_page({
+            "date": "2023-12-25",
+            "include_children": True
+        })
         
         # Should still succeed but with empty blocks
         assert result["success"] is True
@@ -142,9 +156,9 @@ class TestGetJournalPageTool:
         assert result["blocks"] == []
         assert result["journal_name"] == "Dec 25th, 2023"
     
-    @pytest.mark.asyncio
-    async def test_get_journal_page_client_not_initialized(self):
+    @pytest.mark.no_patched_client
+    async def test_get_journal_page_client_not_initialized(self, monkeypatch):
         """Test error when client is not initialized."""
-        with patch("logseq_mcp_server.server.logseq_client", None):
-            with pytest.raises(RuntimeError, match="Logseq client not initialized"):
-                await handle_get_journal_page({"date": "2023-12-25"})
\ No newline at end of file
+        monkeypatch.setattr("logseq_mcp_server.server.logseq_client", None)
+        with pytest.raises(RuntimeError, match="Logseq client not initialized"):
+            await handle_get_journal_page({"date": "2023-12-25"})
\ No newline at end of file
@@ -26,13 +26,11 @@ def mock_logseq_client():
 class TestMCPServer:
     """Test MCP server integration."""
 
-    @pytest.mark.asyncio
     async def test_server_info(self):
         """Test server information."""
         assert app.name == "logseq-mcp"
         assert app.version == "0.1.0"
 
-    @pytest.mark.asyncio
     async def test_list_tools(self):
         """Test listing available tools."""
         tools = await app.list_tools()
@@ -54,7 +52,6 @@ class TestMCPServer:
         for tool_name in expected_tools:
             assert tool_name in tool_names
 
-    @pytest.mark.asyncio
     async def test_tool_schemas(self):
         """Test tool schemas are valid."""
         tools = await app.list_tools()
@@ -66,7 +63,6 @@ class TestMCPServer:
             assert tool.inputSchema.get("type") == "object"
             assert "properties" in tool.inputSchema
 
-    @pytest.mark.asyncio
     async def test_call_get_page_tool_success(self, mock_logseq_client):
         """Test calling get_page tool successfully."""
         mock_page = {
@@ -86,7 +82,6 @@ class TestMCPServer:
             assert isinstance(result[0], TextContent)
             assert "Test Page" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_call_create_block_tool(self, mock_logseq_client):
         """Test calling create_block tool."""
         mock_block = {"uuid": "new-block-uuid", "content": "New block content"}
@@ -101,7 +96,6 @@ class TestMCPServer:
             assert len(result) == 1
             assert "new-block-uuid" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_call_search_pages_tool(self, mock_logseq_client):
         """Test calling search_pages tool."""
         mock_results = [
@@ -117,13 +111,11 @@ class TestMCPServer:
             assert len(result) == 1
             assert "2 pages" in result[0].text
 
-    @pytest.mark.asyncio
     async def test_call_tool_with_invalid_name(self):
         """Test calling a non-existent tool."""
         with pytest.raises(ValueError, match="Unknown tool"):
             await app.call_tool("invalid_tool", {})
 
-    @pytest.mark.asyncio
     async def test_call_tool_with_invalid_arguments(self, mock_logseq_client):
         """Test calling a tool with invalid arguments."""
         mock_logseq_client.create_block.side_effect = ValueError(
@@ -139,7 +131,6 @@ class TestMCPServer:
                 "error" in result[0].text.lower() or "missing" in result[0].text.lower()
             )
 
-    @pytest.mark.asyncio
     async def test_initialization_options(self):
         """Test server initialization options."""
         init_options = app.create_initialization_options()
@@ -148,7 +139,6 @@ class TestMCPServer:
         assert init_options.server_version == "0.1.0"
         assert init_options.capabilities.tools is not None
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_tool(self, mock_logseq_client):
         """Test error handling when tool execution fails."""
         mock_logseq_client.get_page.side_effect = Exception("Connection failed")
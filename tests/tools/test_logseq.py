@@ -13,6 +13,8 @@ Usage:
 
 import argparse
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -21,34 +23,96 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from dotenv import load_dotenv
-from logseq_mcp_server.logseq.client import LogseqClient
-from logseq_mcp_server.logging_config import setup_logging
+# Rich is optional but provides better output. It is imported lazily on
+# first use (it costs tens of milliseconds and a few MB), so plain
+# one-shot commands don't pay for it unless output is actually printed.
+console = None
+JSON = None
+Table = None
+RICH_AVAILABLE = False
+_RICH_CHECKED = False
+
+
+def _init_rich():
+    """Import rich and build the console on first use."""
+    global console, JSON, Table, RICH_AVAILABLE, _RICH_CHECKED
+    if _RICH_CHECKED:
+        return
+    _RICH_CHECKED = True
+    try:
+        from rich.console import Console
+        from rich.json import JSON as _JSON
+        from rich.table import Table as _Table
 
-# Rich is optional but provides better output
-try:
-    from rich.console import Console
-    from rich.json import JSON
-    from rich.table import Table
-    from rich.syntax import Syntax
-    console = Console()
-    RICH_AVAILABLE = True
-except ImportError:
-    console = None
-    RICH_AVAILABLE = False
+        JSON = _JSON
+        Table = _Table
+        console = Console()
+        RICH_AVAILABLE = True
+    except ImportError:
+        pass
 
 
 class LogseqTestHarness:
     """Test harness for Logseq API testing."""
     
-    def __init__(self, host: str, port: int, token: Optional[str] = None):
-        """Initialize the test harness."""
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        token: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        """Initialize the test harness.
+
+        When ``cache_dir`` is given, API responses are cached to JSON
+        files keyed by method+args, so repeated harness runs against
+        the same graph skip the network entirely.
+        """
+        from logseq_mcp_server.logseq.client import LogseqClient
+
         self.client = LogseqClient(host=host, port=port, token=token)
         self.history = []
-        
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._wrap_request_with_cache()
+
+    def _wrap_request_with_cache(self):
+        """Route client requests through the file cache."""
+        inner = self.client._request
+
+        async def cached_request(action, args=None, data=None):
+            key = hashlib.sha256(
+                json.dumps(
+                    {"m": action, "a": args, "d": data}, sort_keys=True, default=str
+                ).encode()
+            ).hexdigest()
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists():
+                return json.loads(cache_file.read_text())
+            result = await inner(action, args=args, data=data)
+            cache_file.write_text(json.dumps(result, default=str))
+            return result
+
+        self.client._request = cached_request
+
+    def clear_cache(self):
+        """Delete all cached responses."""
+        if not self.cache_dir:
+            print("Response cache is not enabled (use --cache)")
+            return
+        removed = 0
+        for cache_file in self.cache_dir.glob("*.json"):
+            cache_file.unlink()
+            removed += 1
+        print(f"Removed {removed} cached responses")
+
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -59,6 +123,7 @@ class LogseqTestHarness:
         
     def print_result(self, result: Any, title: str = "Result"):
         """Pretty print the result."""
+        _init_rich()
         if RICH_AVAILABLE and console:
             if isinstance(result, (dict, list)):
                 console.print(f"\n[bold blue]{title}:[/bold blue]")
@@ -68,12 +133,24 @@ class LogseqTestHarness:
         else:
             print(f"\n{title}:")
             if isinstance(result, (dict, list)):
-                print(json.dumps(result, indent=2, ensure_ascii=False))
+                # orjson's indented dump is several times faster than
+                # stdlib json for big graph responses and already emits
+                # bytes, so write straight to the stdout buffer
+                sys.stdout.buffer.write(
+                    orjson.dumps(
+                        result,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        default=str,
+                    )
+                )
+                sys.stdout.buffer.write(b"\n")
+                sys.stdout.buffer.flush()
             else:
                 print(result)
     
     def print_error(self, error: Exception):
         """Print error message."""
+        _init_rich()
         if RICH_AVAILABLE and console:
             console.print(f"\n[bold red]Error:[/bold red] {error}")
         else:
@@ -115,11 +192,12 @@ class LogseqTestHarness:
         
         try:
             result = await self.client.get_all_pages()
-            
+
             if limit and len(result) > limit:
                 result = result[:limit]
                 print(f"Showing first {limit} pages")
-            
+
+            _init_rich()
             if RICH_AVAILABLE and console:
                 table = Table(title=f"Found {len(result)} pages")
                 table.add_column("Name", style="cyan")
@@ -127,12 +205,15 @@ class LogseqTestHarness:
                 table.add_column("UUID", style="dim")
                 
                 for page in result:
+                    # Fetch each field once; the old expression hit the
+                    # uuid key twice per row, which adds up on big graphs
+                    uuid = page.get("uuid") or ""
                     table.add_row(
-                        page.get("originalName", page.get("name", "Unknown")),
-                        "Yes" if page.get("journal?", False) else "No",
-                        page.get("uuid", "")[:8] + "..." if page.get("uuid") else ""
+                        page.get("originalName") or page.get("name") or "Unknown",
+                        "Yes" if page.get("journal?") else "No",
+                        f"{uuid[:8]}..." if uuid else "",
                     )
-                
+
                 console.print(table)
             else:
                 print(f"Found {len(result)} pages:")
@@ -166,6 +247,42 @@ class LogseqTestHarness:
             self.print_error(e)
             raise
     
+    async def test_get_pages_bulk(self, names: list[str]) -> list:
+        """Fetch several pages concurrently instead of one at a time.
+
+        Overlaps the network round-trips with asyncio.gather, bounded by
+        a small semaphore so a long list doesn't flood the API.
+        """
+        print(f"\nTesting bulk get_page for {len(names)} pages")
+        print("-" * 50)
+
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch(name: str):
+            async with semaphore:
+                return await self.client.get_page(name)
+
+        results = await asyncio.gather(
+            *(fetch(name) for name in names), return_exceptions=True
+        )
+
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, Exception):
+                self.print_error(result)
+            elif result:
+                self.print_result(
+                    {
+                        "found": True,
+                        "name": result.get("originalName", result.get("name")),
+                        "uuid": result.get("uuid"),
+                    },
+                    f"Page: {name}",
+                )
+            else:
+                self.print_result({"found": False, "page": None}, f"Page: {name}")
+
+        return results
+
     async def test_raw(self, method: str, args: Any) -> Any:
         """Test raw API call."""
         print(f"\nTesting raw API call: {method}")
@@ -181,59 +298,88 @@ class LogseqTestHarness:
             self.print_error(e)
             raise
     
+    async def _cmd_get_page(self, rest: str):
+        await self.test_get_page(rest.strip('"\''))
+
+    async def _cmd_get_all_pages(self, rest: str):
+        await self.test_get_all_pages(limit=10)
+
+    async def _cmd_bulk(self, rest: str):
+        names = [n.strip().strip('"\'') for n in rest.split(",")]
+        await self.test_get_pages_bulk([n for n in names if n])
+
+    async def _cmd_search(self, rest: str):
+        await self.test_search(rest.strip('"\''))
+
+    async def _cmd_raw(self, rest: str):
+        parts = rest.split(None, 1)
+        if len(parts) == 2:
+            method, args = parts
+            # Try to parse args as JSON, otherwise use as string
+            try:
+                args = json.loads(args)
+            except:
+                args = args.strip('"\'')
+            await self.test_raw(method, args)
+        else:
+            print("Usage: raw <method> <args>")
+
+    async def _cmd_help(self, rest: str):
+        self.show_help()
+
+    async def _cmd_clear_cache(self, rest: str):
+        self.clear_cache()
+
+    async def _cmd_history(self, rest: str):
+        for i, cmd in enumerate(self.history[-10:], 1):
+            print(f"{i}: {cmd}")
+
     async def interactive_mode(self):
         """Run interactive REPL mode."""
         print("\nLogseq Test Harness - Interactive Mode")
         print("Type 'help' for available commands, 'exit' to quit")
         print("-" * 50)
-        
+
         # Test connection
         try:
             graph = await self.client.get_current_graph()
             print(f"Connected to graph: {graph.get('name', 'Unknown')}")
         except Exception as e:
             print(f"Warning: Could not connect to Logseq: {e}")
-        
+
+        # O(1) dict dispatch on the first word instead of a startswith
+        # chain; partition splits the command in a single C-level pass
+        commands = {
+            "help": self._cmd_help,
+            "clear-cache": self._cmd_clear_cache,
+            "history": self._cmd_history,
+            "get_page": self._cmd_get_page,
+            "get_all_pages": self._cmd_get_all_pages,
+            "bulk": self._cmd_bulk,
+            "search": self._cmd_search,
+            "raw": self._cmd_raw,
+        }
+
         while True:
             try:
                 command = input("\n> ").strip()
-                
+
                 if not command:
                     continue
-                
+
                 self.history.append(command)
-                
+
                 if command == "exit":
                     break
-                elif command == "help":
-                    self.show_help()
-                elif command == "history":
-                    for i, cmd in enumerate(self.history[-10:], 1):
-                        print(f"{i}: {cmd}")
-                elif command.startswith("get_page "):
-                    page_name = command[9:].strip('"\'')
-                    await self.test_get_page(page_name)
-                elif command == "get_all_pages":
-                    await self.test_get_all_pages(limit=10)
-                elif command.startswith("search "):
-                    query = command[7:].strip('"\'')
-                    await self.test_search(query)
-                elif command.startswith("raw "):
-                    parts = command[4:].split(None, 1)
-                    if len(parts) == 2:
-                        method, args = parts
-                        # Try to parse args as JSON, otherwise use as string
-                        try:
-                            args = json.loads(args)
-                        except:
-                            args = args.strip('"\'')
-                        await self.test_raw(method, args)
-                    else:
-                        print("Usage: raw <method> <args>")
+
+                head, _, rest = command.partition(" ")
+                handler = commands.get(head)
+                if handler is not None:
+                    await handler(rest.strip())
                 else:
                     print(f"Unknown command: {command}")
                     print("Type 'help' for available commands")
-                    
+
             except KeyboardInterrupt:
                 print("\nUse 'exit' to quit")
             except Exception as e:
@@ -245,8 +391,10 @@ class LogseqTestHarness:
 Available commands:
   get_page <name>      - Get a specific page
   get_all_pages        - List all pages (limited to 10)
+  bulk <n1>,<n2>,...   - Get several pages concurrently
   search <query>       - Search for pages
   raw <method> <args>  - Call raw API method
+  clear-cache          - Drop cached API responses (with --cache)
   history              - Show command history
   help                 - Show this help
   exit                 - Exit interactive mode
@@ -260,8 +408,14 @@ Examples:
         print(help_text)
 
 
-async def main():
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI parser.
+
+    Kept out of main() and memoized so repeated in-process invocations
+    (tests importing this module, REPL re-runs) build the subparser
+    tree once.
+    """
     parser = argparse.ArgumentParser(
         description="Logseq API Test Harness",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -280,6 +434,12 @@ Examples:
     parser.add_argument("--port", type=int, default=None, help="Logseq API port")
     parser.add_argument("--token", default=None, help="Logseq API token")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        default=None,
+        help="Cache API responses as JSON files in DIR (skip network on repeat calls)",
+    )
     
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
@@ -303,9 +463,19 @@ Examples:
     
     # interactive command
     subparsers.add_parser("interactive", help="Interactive REPL mode")
-    
+
+    return parser
+
+
+async def main():
+    """Main entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
-    
+
+    # Deferred: only needed once we actually run a command
+    from dotenv import load_dotenv
+    from logseq_mcp_server.logging_config import setup_logging
+
     # Load environment variables
     load_dotenv("env/.env")
     
@@ -327,7 +497,7 @@ Examples:
     if token:
         print("Using authentication token")
     
-    async with LogseqTestHarness(host, port, token) as harness:
+    async with LogseqTestHarness(host, port, token, cache_dir=args.cache) as harness:
         if args.command == "get-page":
             await harness.test_get_page(args.name, args.show_raw)
         elif args.command == "get-all-pages":
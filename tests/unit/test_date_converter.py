@@ -1,25 +1,38 @@
 """Tests for date conversion utilities."""
 
+import re
+
 import pytest
 from datetime import date, datetime
 
 from logseq_mcp_server.utils.date_converter import date_to_journal_format, journal_format_to_date
 
+# pytest.raises(match=...) re-compiles string patterns per use; compiled
+# once here, the parametrized error cases just re-search.
+_CANNOT_PARSE_DATE = re.compile("Cannot parse date")
+_CANNOT_PARSE_JOURNAL = re.compile("Cannot parse journal format")
+
 
 class TestDateToJournalFormat:
     """Test date_to_journal_format function."""
     
-    def test_iso_date_string(self):
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("2023-12-25", "Dec 25th, 2023"),
+            ("2023-01-01", "Jan 1st, 2023"),
+            ("2023-02-02", "Feb 2nd, 2023"),
+            ("2023-03-03", "Mar 3rd, 2023"),
+            ("2023-04-04", "Apr 4th, 2023"),
+            ("2023-12-11", "Dec 11th, 2023"),
+            ("2023-12-21", "Dec 21st, 2023"),
+            ("2023-12-22", "Dec 22nd, 2023"),
+            ("2023-12-23", "Dec 23rd, 2023"),
+        ],
+    )
+    def test_iso_date_string(self, inp, expected):
         """Test conversion from ISO date string."""
-        assert date_to_journal_format("2023-12-25") == "Dec 25th, 2023"
-        assert date_to_journal_format("2023-01-01") == "Jan 1st, 2023"
-        assert date_to_journal_format("2023-02-02") == "Feb 2nd, 2023"
-        assert date_to_journal_format("2023-03-03") == "Mar 3rd, 2023"
-        assert date_to_journal_format("2023-04-04") == "Apr 4th, 2023"
-        assert date_to_journal_format("2023-12-11") == "Dec 11th, 2023"
-        assert date_to_journal_format("2023-12-21") == "Dec 21st, 2023"
-        assert date_to_journal_format("2023-12-22") == "Dec 22nd, 2023"
-        assert date_to_journal_format("2023-12-23") == "Dec 23rd, 2023"
+        assert date_to_journal_format(inp) == expected
     
     def test_datetime_object(self):
         """Test conversion from datetime object."""
@@ -31,59 +44,88 @@ class TestDateToJournalFormat:
         d = date(2023, 12, 25)
         assert date_to_journal_format(d) == "Dec 25th, 2023"
     
-    def test_us_date_format(self):
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("12/25/2023", "Dec 25th, 2023"),
+            ("01/01/2023", "Jan 1st, 2023"),
+        ],
+    )
+    def test_us_date_format(self, inp, expected):
         """Test conversion from US date format."""
-        assert date_to_journal_format("12/25/2023") == "Dec 25th, 2023"
-        assert date_to_journal_format("01/01/2023") == "Jan 1st, 2023"
-    
-    def test_eu_date_format(self):
+        assert date_to_journal_format(inp) == expected
+
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("25/12/2023", "Dec 25th, 2023"),
+            ("01/01/2023", "Jan 1st, 2023"),
+        ],
+    )
+    def test_eu_date_format(self, inp, expected):
         """Test conversion from EU date format."""
-        assert date_to_journal_format("25/12/2023") == "Dec 25th, 2023"
-        assert date_to_journal_format("01/01/2023") == "Jan 1st, 2023"
-    
-    def test_already_formatted(self):
+        assert date_to_journal_format(inp) == expected
+
+    @pytest.mark.parametrize(
+        "journal",
+        ["Dec 25th, 2023", "Jan 1st, 2023", "Feb 2nd, 2023", "Mar 3rd, 2023"],
+    )
+    def test_already_formatted(self, journal):
         """Test that already formatted dates are returned as-is."""
-        assert date_to_journal_format("Dec 25th, 2023") == "Dec 25th, 2023"
-        assert date_to_journal_format("Jan 1st, 2023") == "Jan 1st, 2023"
-        assert date_to_journal_format("Feb 2nd, 2023") == "Feb 2nd, 2023"
-        assert date_to_journal_format("Mar 3rd, 2023") == "Mar 3rd, 2023"
-    
-    def test_various_formats(self):
+        assert date_to_journal_format(journal) == journal
+
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("2023/12/25", "Dec 25th, 2023"),
+            ("12-25-2023", "Dec 25th, 2023"),
+            ("20231225", "Dec 25th, 2023"),
+        ],
+    )
+    def test_various_formats(self, inp, expected):
         """Test various other date formats."""
-        assert date_to_journal_format("2023/12/25") == "Dec 25th, 2023"
-        assert date_to_journal_format("12-25-2023") == "Dec 25th, 2023"
-        assert date_to_journal_format("20231225") == "Dec 25th, 2023"
+        assert date_to_journal_format(inp) == expected
     
     def test_invalid_date_format(self):
         """Test that invalid formats raise ValueError."""
-        with pytest.raises(ValueError, match="Cannot parse date"):
+        with pytest.raises(ValueError, match=_CANNOT_PARSE_DATE):
             date_to_journal_format("not a date")
         
-        with pytest.raises(ValueError, match="Cannot parse date"):
+        with pytest.raises(ValueError, match=_CANNOT_PARSE_DATE):
             date_to_journal_format("2023-13-01")  # Invalid month
         
-        with pytest.raises(ValueError, match="Cannot parse date"):
+        with pytest.raises(ValueError, match=_CANNOT_PARSE_DATE):
             date_to_journal_format("2023-12-32")  # Invalid day
 
 
 class TestJournalFormatToDate:
     """Test journal_format_to_date function."""
     
-    def test_valid_journal_format(self):
+    @pytest.mark.parametrize(
+        "journal,expected",
+        [
+            ("Dec 25th, 2023", date(2023, 12, 25)),
+            ("Jan 1st, 2023", date(2023, 1, 1)),
+            ("Feb 2nd, 2023", date(2023, 2, 2)),
+            ("Mar 3rd, 2023", date(2023, 3, 3)),
+            ("Apr 4th, 2023", date(2023, 4, 4)),
+        ],
+    )
+    def test_valid_journal_format(self, journal, expected):
         """Test conversion from journal format to date."""
-        assert journal_format_to_date("Dec 25th, 2023") == date(2023, 12, 25)
-        assert journal_format_to_date("Jan 1st, 2023") == date(2023, 1, 1)
-        assert journal_format_to_date("Feb 2nd, 2023") == date(2023, 2, 2)
-        assert journal_format_to_date("Mar 3rd, 2023") == date(2023, 3, 3)
-        assert journal_format_to_date("Apr 4th, 2023") == date(2023, 4, 4)
-    
-    def test_invalid_journal_format(self):
+        assert journal_format_to_date(journal) == expected
+
+    @pytest.mark.parametrize(
+        "journal",
+        [
+            "Not a journal format",
+            "25th December, 2023",  # Wrong order
+        ],
+    )
+    def test_invalid_journal_format(self, journal):
         """Test that invalid formats raise ValueError."""
-        with pytest.raises(ValueError, match="Cannot parse journal format"):
-            journal_format_to_date("Not a journal format")
-        
-        with pytest.raises(ValueError, match="Cannot parse journal format"):
-            journal_format_to_date("25th December, 2023")  # Wrong order
+        with pytest.raises(ValueError, match=_CANNOT_PARSE_JOURNAL):
+            journal_format_to_date(journal)
 
 
 class TestRoundTrip:
@@ -96,9 +138,9 @@ class TestRoundTrip:
         back_to_date = journal_format_to_date(journal)
         assert back_to_date == original_date
     
-    def test_multiple_dates_round_trip(self):
-        """Test round-trip for multiple dates."""
-        test_dates = [
+    @pytest.mark.parametrize(
+        "d",
+        [
             date(2023, 1, 1),
             date(2023, 2, 2),
             date(2023, 3, 3),
@@ -109,8 +151,12 @@ class TestRoundTrip:
             date(2023, 12, 23),
             date(2023, 12, 31),
         ]
-        
-        for d in test_dates:
-            journal = date_to_journal_format(d)
-            back = journal_format_to_date(journal)
-            assert back == d, f"Round-trip failed for {d}: {journal}"
\ No newline at end of file
+        # Every day of a sample month exercises the full ordinal-suffix table
+        + [date(2024, 5, day) for day in range(1, 32)],
+        ids=str,
+    )
+    def test_multiple_dates_round_trip(self, d):
+        """Test round-trip for multiple dates."""
+        journal = date_to_journal_format(d)
+        back = journal_format_to_date(journal)
+        assert back == d, f"Round-trip failed for {d}: {journal}"
\ No newline at end of file
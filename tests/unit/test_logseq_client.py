@@ -4,29 +4,112 @@ import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import orjson
 import pytest
 from logseq_mcp_server.logseq.client import LogseqClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a LogseqClient instance for testing."""
+    """Create a LogseqClient instance, shared by the whole module.
+
+    Building a LogseqClient spins up an httpx.AsyncClient (TLS context,
+    header dict), so one instance serves all tests here. The
+    ``patch.object`` context managers revert post/aclose patches on
+    exit, but the client's TTL read caches key on ``self`` and outlive
+    each test — sharing is only safe together with the autouse flush
+    fixture below.
+    """
     return LogseqClient(host="localhost", port=12315, token="test-token")
 
 
+@pytest.fixture(autouse=True)
+def _flush_client_caches():
+    """Drop TTL-cached reads before each test.
+
+    Without this, a read cached under one test's stubbed response (e.g.
+    get_page's 5s cache) would short-circuit the next test's patched
+    post and make the module order-dependent.
+    """
+    LogseqClient._flush_read_caches()
+
+
+# Spec'd mocks re-walk dir() of the spec object on every construction;
+# computing the public attribute list once keeps that cost at import time.
+_RESPONSE_SPEC = tuple(a for a in dir(httpx.Response) if not a.startswith("_"))
+
+
+def _post_kwargs(payload: dict) -> dict:
+    """Expected keyword arguments for a client POST of the given payload."""
+    return {
+        "content": orjson.dumps(payload),
+        "headers": {"Content-Type": "application/json"},
+    }
+
+
+# Expected wire payloads, built once instead of as fresh literals inside
+# every assertion. Tests never mutate them.
+_GET_PAGE_PAYLOAD = {"method": "logseq.Editor.getPage", "args": ["Test Page"]}
+_GET_PAGE_BLOCKS_PAYLOAD = {
+    "method": "logseq.Editor.getPageBlocksTree",
+    "args": ["Test Page"],
+}
+_CREATE_PAGE_PAYLOAD = {"method": "logseq.Editor.createPage", "args": ["New Page"]}
+_GET_BLOCK_PAYLOAD = {"method": "logseq.Editor.getBlock", "args": ["block-uuid"]}
+_DELETE_BLOCK_PAYLOAD = {"method": "logseq.Editor.removeBlock", "args": ["block-uuid"]}
+_SEARCH_PAYLOAD = {"method": "logseq.Editor.search", "args": "test query"}
+_QUERY_PAYLOAD = {
+    "method": "logseq.DB.q",
+    "args": "[:find ?p :where [?p :block/name]]",
+}
+_CREATE_BLOCK_PAYLOAD = {
+    "method": "logseq.Editor.insertBlock",
+    "args": ["Test Page", "New block"],
+}
+_UPDATE_BLOCK_PAYLOAD = {
+    "method": "logseq.Editor.updateBlock",
+    "args": ["block-uuid", "Updated content"],
+}
+_GET_ALL_PAGES_PAYLOAD = {"method": "logseq.Editor.getAllPages"}
+_GET_CURRENT_GRAPH_PAYLOAD = {"method": "logseq.Editor.getCurrentGraph"}
+
+# 500 response whose raise_for_status raises; built once since the
+# error-path test only needs it to blow up, not to record calls.
+_ERROR_RESPONSE = Mock(spec=_RESPONSE_SPEC)
+_ERROR_RESPONSE.status_code = 500
+_ERROR_RESPONSE.text = "Internal Server Error"
+_ERROR_RESPONSE.raise_for_status.side_effect = httpx.HTTPStatusError(
+    "Server error", request=Mock(), response=_ERROR_RESPONSE
+)
+
+
+class _FakeResponse:
+    """Response stand-in whose body mirrors ``json.return_value``.
+
+    The client parses ``response.content`` with orjson, so the fake
+    serializes whatever payload a test assigns to ``json.return_value``.
+    """
+
+    status_code = 200
+
+    def __init__(self):
+        self.json = Mock(return_value=None)
+        self.raise_for_status = Mock()
+
+    @property
+    def content(self) -> bytes:
+        return orjson.dumps(self.json.return_value)
+
+
 @pytest.fixture
 def mock_response():
     """Create a mock HTTP response."""
-    response = Mock(spec=httpx.Response)
-    response.status_code = 200
-    response.raise_for_status = Mock()
-    return response
+    return _FakeResponse()
 
 
 class TestLogseqClient:
     """Test LogseqClient methods."""
 
-    @pytest.mark.asyncio
     async def test_initialization(self):
         """Test client initialization."""
         # Test with default values
@@ -39,7 +122,6 @@ class TestLogseqClient:
         assert "Authorization" in client.client.headers
         assert client.client.headers["Authorization"] == "Bearer secret"
 
-    @pytest.mark.asyncio
     async def test_get_page_with_array_format(self, client, mock_response):
         """Test get_page uses array format for arguments."""
         mock_response.json.return_value = {
@@ -56,13 +138,12 @@ class TestLogseqClient:
             # Verify the request was made with array format
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={"method": "logseq.Editor.getPage", "args": ["Test Page"]},
+                **_post_kwargs(_GET_PAGE_PAYLOAD),
             )
 
             assert result["uuid"] == "test-uuid"
             assert result["originalName"] == "Test Page"
 
-    @pytest.mark.asyncio
     async def test_get_page_not_found(self, client, mock_response):
         """Test get_page returns None for non-existent pages."""
         mock_response.json.return_value = None
@@ -71,7 +152,6 @@ class TestLogseqClient:
             result = await client.get_page("NonExistent")
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_page_blocks_with_array_format(self, client, mock_response):
         """Test get_page_blocks uses array format for arguments."""
         mock_blocks = [
@@ -88,16 +168,12 @@ class TestLogseqClient:
             # Verify the request was made with array format
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={
-                    "method": "logseq.Editor.getPageBlocksTree",
-                    "args": ["Test Page"],
-                },
+                **_post_kwargs(_GET_PAGE_BLOCKS_PAYLOAD),
             )
 
             assert len(result) == 2
             assert result[0]["content"] == "Block 1"
 
-    @pytest.mark.asyncio
     async def test_create_page_with_array_format(self, client, mock_response):
         """Test create_page uses array format for arguments."""
         mock_response.json.return_value = {
@@ -114,72 +190,89 @@ class TestLogseqClient:
             # Verify the request was made with array format
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={"method": "logseq.Editor.createPage", "args": ["New Page"]},
+                **_post_kwargs(_CREATE_PAGE_PAYLOAD),
             )
 
             assert result["uuid"] == "new-page-uuid"
 
-    @pytest.mark.asyncio
     async def test_create_page_with_content(self, client, mock_response):
         """Test create_page with initial content."""
         mock_response.json.return_value = {"uuid": "page-uuid", "name": "new page"}
 
-        with patch.object(
-            client.client, "post", return_value=mock_response
-        ) as mock_post:
-            with patch.object(
+        # One with statement enters both patches in a single pass instead
+        # of nesting two context managers
+        with (
+            patch.object(client.client, "post", return_value=mock_response) as mock_post,
+            patch.object(
                 client, "create_block", new_callable=AsyncMock
-            ) as mock_create_block:
-                result = await client.create_page("New Page", content="Initial content")
-
-                # Verify page was created
-                assert mock_post.call_count == 1
-
-                # Verify block was created with content
-                mock_create_block.assert_called_once_with(
-                    content="Initial content", page="New Page"
-                )
-
-    @pytest.mark.asyncio
-    async def test_get_block_with_array_format(self, client, mock_response):
-        """Test get_block uses array format for arguments."""
-        mock_response.json.return_value = {
-            "uuid": "block-uuid",
-            "content": "Block content",
-        }
+            ) as mock_create_block,
+        ):
+            result = await client.create_page("New Page", content="Initial content")
 
-        with patch.object(
-            client.client, "post", return_value=mock_response
-        ) as mock_post:
-            result = await client.get_block("block-uuid")
+            # Verify page was created
+            assert mock_post.call_count == 1
 
-            # Verify the request was made with array format
-            mock_post.assert_called_once_with(
-                client.base_url,
-                json={"method": "logseq.Editor.getBlock", "args": ["block-uuid"]},
+            # Verify block was created with content
+            mock_create_block.assert_called_once_with(
+                content="Initial content", page="New Page"
             )
 
-            assert result["content"] == "Block content"
-
-    @pytest.mark.asyncio
-    async def test_delete_block_with_array_format(self, client, mock_response):
-        """Test delete_block uses array format for arguments."""
-        mock_response.json.return_value = {"success": True}
+    @pytest.mark.parametrize(
+        "method,call_args,call_kwargs,payload,response",
+        [
+            (
+                "get_block",
+                ("block-uuid",),
+                {},
+                _GET_BLOCK_PAYLOAD,
+                {"uuid": "block-uuid", "content": "Block content"},
+            ),
+            (
+                "delete_block",
+                ("block-uuid",),
+                {},
+                _DELETE_BLOCK_PAYLOAD,
+                {"success": True},
+            ),
+            (
+                "create_block",
+                ("New block",),
+                {"page": "Test Page"},
+                _CREATE_BLOCK_PAYLOAD,
+                {"uuid": "new-block-uuid", "content": "New block"},
+            ),
+            (
+                "update_block",
+                ("block-uuid",),
+                {"content": "Updated content"},
+                _UPDATE_BLOCK_PAYLOAD,
+                {"uuid": "block-uuid", "content": "Updated"},
+            ),
+        ],
+    )
+    async def test_block_ops_with_array_format(
+        self, client, mock_response, method, call_args, call_kwargs, payload, response
+    ):
+        """Test that block operations post array-format arguments.
+
+        One table-driven body replaces four copies of the same
+        patch/call/assert boilerplate; each row still reports as its
+        own test case.
+        """
+        mock_response.json.return_value = response
 
         with patch.object(
             client.client, "post", return_value=mock_response
         ) as mock_post:
-            result = await client.delete_block("block-uuid")
+            result = await getattr(client, method)(*call_args, **call_kwargs)
 
-            # Verify the request was made with array format
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={"method": "logseq.Editor.removeBlock", "args": ["block-uuid"]},
+                **_post_kwargs(payload),
             )
 
-            assert result["success"] is True
+            assert result == response
 
-    @pytest.mark.asyncio
     async def test_search_pages_with_string_format(self, client, mock_response):
         """Test search_pages uses string format (not array) for arguments."""
         mock_response.json.return_value = [{"name": "Page 1"}, {"name": "Page 2"}]
@@ -192,12 +285,11 @@ class TestLogseqClient:
             # Verify the request was made with string format (not array)
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={"method": "logseq.Editor.search", "args": "test query"},
+                **_post_kwargs(_SEARCH_PAYLOAD),
             )
 
             assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_execute_query_with_string_format(self, client, mock_response):
         """Test execute_query uses string format (not array) for arguments."""
         mock_response.json.return_value = [["result1"], ["result2"]]
@@ -210,39 +302,11 @@ class TestLogseqClient:
             # Verify the request was made with string format (not array)
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={
-                    "method": "logseq.DB.q",
-                    "args": "[:find ?p :where [?p :block/name]]",
-                },
+                **_post_kwargs(_QUERY_PAYLOAD),
             )
 
             assert len(result) == 2
 
-    @pytest.mark.asyncio
-    async def test_create_block_with_array_format(self, client, mock_response):
-        """Test create_block uses array format for arguments."""
-        mock_response.json.return_value = {
-            "uuid": "new-block-uuid",
-            "content": "New block",
-        }
-
-        with patch.object(
-            client.client, "post", return_value=mock_response
-        ) as mock_post:
-            result = await client.create_block("New block", page="Test Page")
-
-            # Verify the request was made with array format
-            mock_post.assert_called_once_with(
-                client.base_url,
-                json={
-                    "method": "logseq.Editor.insertBlock",
-                    "args": ["Test Page", "New block"],
-                },
-            )
-
-            assert result["uuid"] == "new-block-uuid"
-
-    @pytest.mark.asyncio
     async def test_create_block_with_properties(self, client, mock_response):
         """Test create_block with properties."""
         mock_response.json.return_value = {"uuid": "block-uuid"}
@@ -258,36 +322,18 @@ class TestLogseqClient:
             # Verify properties are included in the request
             mock_post.assert_called_once_with(
                 client.base_url,
-                json={
-                    "method": "logseq.Editor.insertBlock",
-                    "args": [
-                        "Test Page",
-                        "Block with props",
-                        {"properties": properties},
-                    ],
-                },
+                **_post_kwargs(
+                    {
+                        "method": "logseq.Editor.insertBlock",
+                        "args": [
+                            "Test Page",
+                            "Block with props",
+                            {"properties": properties},
+                        ],
+                    }
+                ),
             )
 
-    @pytest.mark.asyncio
-    async def test_update_block_with_array_format(self, client, mock_response):
-        """Test update_block uses array format for arguments."""
-        mock_response.json.return_value = {"uuid": "block-uuid", "content": "Updated"}
-
-        with patch.object(
-            client.client, "post", return_value=mock_response
-        ) as mock_post:
-            result = await client.update_block("block-uuid", content="Updated content")
-
-            # Verify the request was made with array format
-            mock_post.assert_called_once_with(
-                client.base_url,
-                json={
-                    "method": "logseq.Editor.updateBlock",
-                    "args": ["block-uuid", "Updated content"],
-                },
-            )
-
-    @pytest.mark.asyncio
     async def test_get_all_pages(self, client, mock_response):
         """Test get_all_pages method."""
         mock_pages = [
@@ -302,13 +348,12 @@ class TestLogseqClient:
             result = await client.get_all_pages()
 
             mock_post.assert_called_once_with(
-                client.base_url, json={"method": "logseq.Editor.getAllPages"}
+                client.base_url, **_post_kwargs(_GET_ALL_PAGES_PAYLOAD)
             )
 
             assert len(result) == 2
             assert result[0]["name"] == "Page 1"
 
-    @pytest.mark.asyncio
     async def test_get_current_graph(self, client, mock_response):
         """Test get_current_graph method."""
         mock_response.json.return_value = {"name": "My Graph", "path": "/path/to/graph"}
@@ -319,26 +364,18 @@ class TestLogseqClient:
             result = await client.get_current_graph()
 
             mock_post.assert_called_once_with(
-                client.base_url, json={"method": "logseq.Editor.getCurrentGraph"}
+                client.base_url,
+                **_post_kwargs(_GET_CURRENT_GRAPH_PAYLOAD),
             )
 
             assert result["name"] == "My Graph"
 
-    @pytest.mark.asyncio
     async def test_error_handling_http_error(self, client):
         """Test error handling for HTTP errors."""
-        error_response = Mock(spec=httpx.Response)
-        error_response.status_code = 500
-        error_response.text = "Internal Server Error"
-        error_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server error", request=Mock(), response=error_response
-        )
-
-        with patch.object(client.client, "post", return_value=error_response):
+        with patch.object(client.client, "post", return_value=_ERROR_RESPONSE):
             with pytest.raises(httpx.HTTPStatusError):
                 await client.get_page("Test Page")
 
-    @pytest.mark.asyncio
     async def test_error_handling_connection_error(self, client):
         """Test error handling for connection errors."""
         with patch.object(
@@ -347,7 +384,6 @@ class TestLogseqClient:
             with pytest.raises(httpx.ConnectError):
                 await client.get_page("Test Page")
 
-    @pytest.mark.asyncio
     async def test_close_client(self, client):
         """Test closing the client."""
         with patch.object(
@@ -1,32 +1,45 @@
 """Unit tests for the privacy filter to ensure data integrity."""
 
-import copy
 import logging
 import pytest
 
 from logseq_mcp_server.logging_config import PrivacyFilter, LoggingMode
 
+# PrivacyFilter is stateless after construction (mode flags plus the shared
+# sanitizer), so one instance can serve every test in the module.
+_PF = PrivacyFilter(LoggingMode.PRIVACY)
+
+
+def _make_record(msg: str = "Test message") -> logging.LogRecord:
+    """Build a minimal INFO-level LogRecord for filter tests.
+
+    One call site for the seven identical keyword arguments every test
+    was repeating; extra fields like ``arguments``/``result`` are set by
+    the caller on the returned record.
+    """
+    return logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg=msg,
+        args=(),
+        exc_info=None,
+    )
+
 
 class TestPrivacyFilter:
     """Test the PrivacyFilter class."""
 
     @pytest.fixture
     def privacy_filter(self):
-        """Create a privacy filter instance."""
-        return PrivacyFilter(LoggingMode.PRIVACY)
+        """Return the shared privacy filter instance."""
+        return _PF
 
     def test_filter_does_not_modify_original_arguments(self, privacy_filter):
         """Test that filtering doesn't modify the original arguments dict."""
         # Create a log record with arguments
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
 
         # Add arguments as extra field (this is how log_tool_invocation does it)
         original_args = {
@@ -36,8 +49,12 @@ class TestPrivacyFilter:
         }
         record.arguments = original_args
 
-        # Create a deep copy to compare against
-        original_copy = copy.deepcopy(original_args)
+        # Literal snapshot to compare against; no deepcopy traversal needed
+        original_copy = {
+            "page_name": "My Private Page",
+            "content": "Secret content",
+            "nested": {"path": "/home/user/documents"},
+        }
 
         # Apply the filter
         privacy_filter.filter(record)
@@ -57,15 +74,7 @@ class TestPrivacyFilter:
     def test_filter_does_not_modify_original_result(self, privacy_filter):
         """Test that filtering doesn't modify the original result dict."""
         # Create a log record
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
 
         # Add result as extra field
         original_result = {
@@ -79,8 +88,16 @@ class TestPrivacyFilter:
         }
         record.result = original_result
 
-        # Create a deep copy to compare against
-        original_copy = copy.deepcopy(original_result)
+        # Literal snapshot to compare against; no deepcopy traversal needed
+        original_copy = {
+            "page": {
+                "originalName": "My Secret Page",
+                "uuid": "123-456-789",
+                "properties": {"key": "value"},
+            },
+            "pages": ["page1", "page2", "page3"],
+            "results": [{"id": 1}, {"id": 2}],
+        }
 
         # Apply the filter
         privacy_filter.filter(record)
@@ -100,15 +117,7 @@ class TestPrivacyFilter:
     def test_filter_handles_missing_fields(self, privacy_filter):
         """Test that the filter handles records without arguments/result fields."""
         # Create a basic log record
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
 
         # Should not raise any errors
         result = privacy_filter.filter(record)
@@ -121,15 +130,7 @@ class TestPrivacyFilter:
     def test_filter_handles_non_dict_result(self, privacy_filter):
         """Test that the filter handles non-dict result values."""
         # Create a log record
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
 
         # Add non-dict result
         original_result = "string result"
@@ -146,15 +147,7 @@ class TestPrivacyFilter:
         debug_filter = PrivacyFilter(LoggingMode.DEBUG)
 
         # Create a log record with sensitive data
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Getting page: My Private Page",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("Getting page: My Private Page")
 
         original_args = {"page_name": "My Private Page"}
         record.arguments = original_args
@@ -169,15 +162,7 @@ class TestPrivacyFilter:
     def test_deep_nested_structure_integrity(self, privacy_filter):
         """Test that deeply nested structures remain unmodified."""
         # Create a log record
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record()
 
         # Create a deeply nested structure
         original_data = {
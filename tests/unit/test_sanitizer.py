@@ -4,39 +4,50 @@ import pytest
 
 from logseq_mcp_server.utils.sanitizer import LogSanitizer
 
+# Shared test strings, built once at import instead of per test run.
+_LONG_A = "A" * 60
+_DATALOG_Q = (
+    '[:find ?b :where [?b :block/content ?c] '
+    '[(clojure.string/includes? ?c "password")]]'
+)
+_DATALOG_Q_EXPECTED = f"[datalog_query_{len(_DATALOG_Q)}_chars]"
+
 
 class TestLogSanitizer:
     """Test the LogSanitizer class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sanitizer(self):
-        """Create a sanitizer instance."""
+        """Create a sanitizer instance, shared across the session.
+
+        LogSanitizer is stateless after __init__ (rule tables and
+        compiled patterns), so one instance serves every test.
+        """
         return LogSanitizer()
 
-    def test_sanitize_page_name_empty(self, sanitizer):
-        """Test sanitizing empty page names."""
-        assert sanitizer.sanitize_page_name(None) == "[empty]"
-        assert sanitizer.sanitize_page_name("") == "[empty]"
-
-    def test_sanitize_page_name_short(self, sanitizer):
-        """Test sanitizing short page names."""
-        # Names <= min_mask_length are not masked
-        assert sanitizer.sanitize_page_name("ABC") == "ABC"
-        assert sanitizer.sanitize_page_name("XY") == "XY"
-
-    def test_sanitize_page_name_journal(self, sanitizer):
-        """Test sanitizing journal page names."""
-        assert sanitizer.sanitize_page_name("Jul 1st, 2024") == "[journal_page]"
-        assert sanitizer.sanitize_page_name("December 25th, 2023") == "[journal_page]"
-
-    def test_sanitize_page_name_regular(self, sanitizer):
-        """Test sanitizing regular page names."""
-        # For "My Private Notes" (16 chars), visible_chars = 16//4 = 4
-        assert sanitizer.sanitize_page_name("My Private Notes") == "My P***otes"
-        # For "TODO List" (9 chars), visible_chars = 9//4 = 2
-        assert sanitizer.sanitize_page_name("TODO List") == "TO***st"
-        # For "Work" (4 chars), visible_chars = 1
-        assert sanitizer.sanitize_page_name("Work") == "W***k"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            (None, "[empty]"),
+            ("", "[empty]"),
+            # Names <= min_mask_length are not masked
+            ("ABC", "ABC"),
+            ("XY", "XY"),
+            ("Jul 1st, 2024", "[journal_page]"),
+            ("December 25th, 2023", "[journal_page]"),
+            # For "My Private Notes" (16 chars), visible_chars = 16//4 = 4
+            ("My Private Notes", "My P***otes"),
+            # For "TODO List" (9 chars), visible_chars = 9//4 = 2
+            ("TODO List", "TO***st"),
+            # For "Work" (4 chars), visible_chars = 1
+            ("Work", "W***k"),
+        ],
+        ids=["none", "blank", "short3", "short2", "journal-abbr", "journal-full",
+             "regular16", "regular9", "regular4"],
+    )
+    def test_sanitize_page_name(self, sanitizer, name, expected):
+        """Test page name sanitization across empty/short/journal/regular."""
+        assert sanitizer.sanitize_page_name(name) == expected
 
     def test_sanitize_content(self, sanitizer):
         """Test content sanitization."""
@@ -60,80 +71,79 @@ class TestLogSanitizer:
         assert result1.startswith("block_")
         assert len(result1) == 12  # "block_" + 6 chars
 
-    def test_sanitize_path_unix(self, sanitizer):
-        """Test Unix path sanitization."""
-        assert sanitizer.sanitize_path("/home/john/Documents") == "/home/***/Documents"
-        assert sanitizer.sanitize_path("/Users/jane/Logseq") == "/Users/***/Logseq"
-        assert (
-            sanitizer.sanitize_path("/home/user/graphs/work") == "/home/***/graphs/***"
-        )
-
-    def test_sanitize_path_windows(self, sanitizer):
-        """Test Windows path sanitization."""
-        assert (
-            sanitizer.sanitize_path("C:\\Users\\john\\Documents")
-            == "C:\\Users\\***\\Documents"
-        )
-        assert (
-            sanitizer.sanitize_path("\\Users\\jane\\graphs\\personal")
-            == "\\Users\\***\\graphs\\***"
-        )
-
-    def test_sanitize_properties_sensitive(self, sanitizer):
-        """Test sanitizing sensitive properties."""
-        props = {
-            "password": "secret123",
-            "api_key": "sk-1234567890",
-            "email": "john@example.com",
-            "normal": "value",
-        }
-        result = sanitizer.sanitize_properties(props)
-
-        assert result["password"] == "[REDACTED]"
-        assert result["api_key"] == "[REDACTED]"
-        assert result["email"] == "[REDACTED]"
-        assert result["normal"] == "value"
-
-    def test_sanitize_properties_urls(self, sanitizer):
-        """Test sanitizing URL properties."""
-        props = {
-            "url": "https://example.com/secret/path",
-            "website": "http://mysite.com/private",
-            "link": "short",
-        }
-        result = sanitizer.sanitize_properties(props)
-
-        assert result["url"] == "example.com/***"
-        assert result["website"] == "mysite.com/***"
-        assert result["link"] == "short"  # Too short to sanitize
-
-    def test_sanitize_properties_long_values(self, sanitizer):
-        """Test sanitizing long property values."""
-        props = {
-            "description": "A" * 60,  # Long string
-            "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],  # Long list
-            "metadata": {
-                "key1": "val1",
-                "key2": "val2",
-                "key3": "val3",
-            },  # Complex dict
-        }
-        result = sanitizer.sanitize_properties(props)
-
-        assert result["description"] == "[string_60_chars]"
-        # Lists are not sanitized by sanitize_properties unless they're long (>100 chars when stringified)
-        assert result["tags"] == ["tag1", "tag2", "tag3", "tag4", "tag5"]
-        # Dicts are not sanitized unless they're long
-        assert result["metadata"] == {"key1": "val1", "key2": "val2", "key3": "val3"}
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/home/john/Documents", "/home/***/Documents"),
+            ("/Users/jane/Logseq", "/Users/***/Logseq"),
+            ("/home/user/graphs/work", "/home/***/graphs/***"),
+            ("C:\\Users\\john\\Documents", "C:\\Users\\***\\Documents"),
+            ("\\Users\\jane\\graphs\\personal", "\\Users\\***\\graphs\\***"),
+        ],
+        ids=["unix-home", "unix-users", "unix-graphs", "win-users", "win-graphs"],
+    )
+    def test_sanitize_path(self, sanitizer, path, expected):
+        """Test Unix and Windows path sanitization."""
+        assert sanitizer.sanitize_path(path) == expected
+
+    @pytest.mark.parametrize(
+        "props,expected",
+        [
+            (
+                {
+                    "password": "secret123",
+                    "api_key": "sk-1234567890",
+                    "email": "john@example.com",
+                    "normal": "value",
+                },
+                {
+                    "password": "[REDACTED]",
+                    "api_key": "[REDACTED]",
+                    "email": "[REDACTED]",
+                    "normal": "value",
+                },
+            ),
+            (
+                {
+                    "url": "https://example.com/secret/path",
+                    "website": "http://mysite.com/private",
+                    "link": "short",  # Too short to sanitize
+                },
+                {
+                    "url": "example.com/***",
+                    "website": "mysite.com/***",
+                    "link": "short",
+                },
+            ),
+            (
+                {
+                    "description": _LONG_A,  # Long string
+                    # Genuinely short lists and dicts pass through unchanged
+                    "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
+                    "metadata": {"key1": "val1", "key2": "val2", "key3": "val3"},
+                    # Few items, but the content blows the character budget
+                    "notes": [_LONG_A * 3],
+                },
+                {
+                    "description": "[string_60_chars]",
+                    "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
+                    "metadata": {"key1": "val1", "key2": "val2", "key3": "val3"},
+                    "notes": "[list_with_1_items]",
+                },
+            ),
+        ],
+        ids=["sensitive", "urls", "long-values"],
+    )
+    def test_sanitize_properties(self, sanitizer, props, expected):
+        """Test property sanitization of sensitive keys, URLs and long values."""
+        assert sanitizer.sanitize_properties(props) == expected
 
     def test_sanitize_query(self, sanitizer):
         """Test query sanitization."""
         assert sanitizer.sanitize_query(None) == "[empty]"
         assert sanitizer.sanitize_query("") == "[empty]"
 
-        query = '[:find ?b :where [?b :block/content ?c] [(clojure.string/includes? ?c "password")]]'
-        # The actual length is 83, not 87
-        assert sanitizer.sanitize_query(query) == f"[datalog_query_{len(query)}_chars]"
+        assert sanitizer.sanitize_query(_DATALOG_Q) == _DATALOG_Q_EXPECTED
 
     def test_sanitize_dict_basic(self, sanitizer):
         """Test basic dictionary sanitization."""
@@ -151,26 +161,16 @@ class TestLogSanitizer:
         assert result["success"] is True
         assert result["count"] == 42
 
-    def test_sanitize_dict_nested(self, sanitizer):
+    def test_sanitize_dict_nested(self, sanitizer, nested_sanitize_input):
         """Test nested dictionary sanitization."""
-        data = {
-            "page": {"name": "Nested Page", "path": "/home/user/logseq"},
-            "blocks": [
-                {"content": "Block 1", "uuid": "uuid-1"},
-                {"content": "Block 2", "uuid": "uuid-2"},
-            ],
-        }
-        result = sanitizer.sanitize_dict(data)
+        result = sanitizer.sanitize_dict(nested_sanitize_input)
 
         # "Nested Page" (11 chars), visible = 11//4 = 2
         assert result["page"]["name"] == "Ne***ge"
         assert result["page"]["path"] == "/home/***/logseq"
         assert result["blocks"][0]["content"] == "[content_7_chars]"
-        # Check the actual hash for "uuid-1"
-        import hashlib
-
-        hash_val = hashlib.sha256("uuid-1".encode()).hexdigest()[:6]
-        assert result["blocks"][0]["uuid"] == f"block_{hash_val}"
+        # crc32(b"uuid-1") & 0xFFFFFF, precomputed
+        assert result["blocks"][0]["uuid"] == "block_1bd3ce"
 
     def test_sanitize_dict_custom_rules(self, sanitizer):
         """Test dictionary sanitization with custom rules."""